@@ -2,20 +2,20 @@
 """Generate comparison visualizations of old vs new cone texture edges."""
 
 from PIL import Image
+import io
 import math
+import subprocess
 
 def visualize_edge(img_path, output_path, label):
     """Create a magnified view of the cone edge at 75% radius."""
     img = Image.open(img_path)
-    pixels = img.load()
     width, height = img.size
 
     center_x = width / 2.0
     center_y = height / 2.0
 
     vis_size = 400
-    vis = Image.new("RGBA", (vis_size, vis_size), (0, 0, 0, 255))
-    vis_pixels = vis.load()
+    src_size = vis_size // 4
 
     # Show a section of the cone edge at 75% radius, magnified 4x
     dist = int(width / 2.0 * 0.75)
@@ -23,29 +23,40 @@ def visualize_edge(img_path, output_path, label):
     src_x_start = int(center_x + dist - vis_size // 8)
     src_y_start = int(center_y - edge_y_center - vis_size // 8)
 
-    for vy in range(vis_size):
-        for vx in range(vis_size):
-            src_x = src_x_start + vx // 4
-            src_y = src_y_start + vy // 4
-            if 0 <= src_x < width and 0 <= src_y < height:
-                r, g, b, a = pixels[src_x, src_y]
-                vis_pixels[vx, vy] = (a, a, a, 255)
+    # crop() pads out-of-bounds areas with zero alpha, which renders as black
+    crop = img.crop((src_x_start, src_y_start, src_x_start + src_size, src_y_start + src_size))
+    a = crop.resize((vis_size, vis_size), Image.NEAREST).getchannel("A")
+    vis = Image.merge("RGBA", (a, a, a, Image.new("L", a.size, 255)))
 
-    vis.save(output_path)
+    vis.save(output_path, optimize=False, compress_level=1)
     print(f"Saved {label}: {output_path}")
 
+def read_git_blobs(specs):
+    """Read several `<rev>:<path>` blobs through one `git cat-file --batch` process."""
+    proc = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        input="".join(f"{spec}\n" for spec in specs).encode(),
+        capture_output=True,
+    )
+    out = proc.stdout
+    blobs = {}
+    pos = 0
+    for spec in specs:
+        # Each frame is "<sha> <type> <size>\n<content>\n" (or "<spec> missing\n")
+        header_end = out.index(b"\n", pos)
+        header = out[pos:header_end].split()
+        if header[-1] == b"missing":
+            raise FileNotFoundError(f"git object not found: {spec}")
+        size = int(header[2])
+        blobs[spec] = out[header_end + 1:header_end + 1 + size]
+        pos = header_end + 1 + size + 1
+    return blobs
+
 # Generate old edge from the original texture stored in git
-import subprocess
-import tempfile, os
+ORIGINAL_TEXTURE = "4580fb6:assets/sprites/effects/flashlight_cone_18deg.png"
 
 # Extract original 512x512 texture from before our changes
-result = subprocess.run(
-    ["git", "show", "4580fb6:assets/sprites/effects/flashlight_cone_18deg.png"],
-    capture_output=True
-)
-old_path = "/tmp/original_512_texture.png"
-with open(old_path, "wb") as f:
-    f.write(result.stdout)
-
-visualize_edge(old_path, "../docs/case-studies/issue-585/edge_original_512.png", "Original 512x512 edge")
+blobs = read_git_blobs([ORIGINAL_TEXTURE])
+
+visualize_edge(io.BytesIO(blobs[ORIGINAL_TEXTURE]), "../docs/case-studies/issue-585/edge_original_512.png", "Original 512x512 edge")
 visualize_edge("../assets/sprites/effects/flashlight_cone_18deg.png", "../docs/case-studies/issue-585/edge_new_2048.png", "New 2048x2048 edge")
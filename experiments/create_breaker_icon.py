@@ -7,8 +7,32 @@ Size: 64x64 pixels, RGBA mode.
 """
 
 from PIL import Image, ImageDraw
+import numpy as np
 import math
 
+# Diamond-shaped shrapnel piece (size 2), rasterized once and pasted per piece
+SHRAPNEL_MASK = Image.new('1', (5, 5), 0)
+ImageDraw.Draw(SHRAPNEL_MASK).polygon([(0, 2), (2, 0), (4, 2), (2, 4)], fill=1)
+
+
+def _glow_bands():
+    """Per-pixel glow band of the 17x17 glow box: the smallest radius r in
+    3..8 whose disk covers the pixel, 9 outside the r=8 disk.
+
+    The disks are rasterised with draw.ellipse, so the bands match the
+    ellipse fills they replace exactly (a plain d^2 test does not at r=6).
+    """
+    band = np.full((17, 17), 9)
+    for r in range(8, 2, -1):
+        disk = Image.new('1', (17, 17), 0)
+        ImageDraw.Draw(disk).ellipse([8 - r, 8 - r, 8 + r, 8 + r], fill=1)
+        band[np.asarray(disk)] = r
+    return band
+
+
+GLOW_BAND = _glow_bands()
+
+
 def create_breaker_bullets_icon():
     size = 64
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
@@ -71,22 +95,18 @@ def create_breaker_bullets_icon():
 
     for sx, sy, angle in shrapnel_positions:
         # Small diamond-shaped shrapnel pieces
-        rad = math.radians(angle)
-        s = 2  # size
-        points = [
-            (sx - s, sy),
-            (sx, sy - s),
-            (sx + s, sy),
-            (sx, sy + s),
-        ]
-        draw.polygon(points, fill=shrapnel_color)
+        img.paste(shrapnel_color, (sx - 2, sy - 2), SHRAPNEL_MASK)
 
     # Explosion glow at detonation point (between bullet and shrapnel)
     # Orange-yellow glow
-    for r in range(8, 2, -1):
-        alpha = int(60 * (8 - r) / 6)
-        glow_color = (255, 160, 40, alpha)
-        draw.ellipse([cx + 22 - r, cy - r, cx + 22 + r, cy + r], fill=glow_color)
+    # Concentric bands r=8..3 with alpha rising by 10 per step towards the
+    # centre, pasted once from the precomputed band map (see GLOW_BAND)
+    # instead of six ellipse fills
+    glow = np.empty((17, 17, 4), dtype=np.uint8)
+    glow[:, :, :3] = (255, 160, 40)
+    glow[:, :, 3] = np.clip(10 * (8 - GLOW_BAND), 0, 255)
+    glow_mask = Image.fromarray(GLOW_BAND <= 8)  # 1-bit mode
+    img.paste(Image.fromarray(glow, 'RGBA'), (cx + 14, cy - 8), glow_mask)
 
     # Small bright center at detonation point
     draw.ellipse([cx + 20, cy - 3, cx + 26, cy + 3], fill=(255, 220, 100, 150))
@@ -118,5 +138,5 @@ if __name__ == '__main__':
 
     # Also save preview
     preview_path = '/tmp/gh-issue-solver-1770592260660/experiments/breaker_icon_preview.png'
-    icon.save(preview_path)
+    icon.save(preview_path, optimize=False, compress_level=1)
     print(f"Preview saved to {preview_path}")
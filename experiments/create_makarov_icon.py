@@ -3,13 +3,10 @@ Create an armory menu icon for the Makarov PM pistol.
 Similar in style to the silenced_pistol_icon.png but without suppressor.
 Icons are larger/more detailed versions of the top-down sprites.
 """
-from PIL import Image
+from sprite_gen import build, spec_key, is_up_to_date, mark_up_to_date, save_png
 
 # Create a 60x24 icon (similar to mini_uzi_icon size)
-width, height = 60, 24
-img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-
-pixels = img.load()
+SIZE = (60, 24)
 
 # Colors
 barrel_dark = (60, 60, 60, 255)
@@ -26,121 +23,92 @@ highlight = (120, 120, 120, 255)
 
 # Draw the Makarov PM side view (profile) for icon
 # Pointing right, standard pistol profile
-
-# Slide (upper part) - x: 10-50, y: 4-11
-for x in range(10, 51):
-    for y in range(4, 12):
-        if y == 4 or y == 11:
-            pixels[x, y] = outline
-        elif x == 10 or x == 50:
-            pixels[x, y] = outline
-        elif y == 5:
-            pixels[x, y] = slide_top
-        elif y == 6:
-            pixels[x, y] = slide_light
-        elif y >= 9:
-            pixels[x, y] = barrel_dark
-        else:
-            pixels[x, y] = slide_color
-
-# Barrel protrusion (front of slide) - x: 48-55, y: 6-10
-for x in range(48, 56):
-    for y in range(6, 11):
-        if y == 6 or y == 10:
-            pixels[x, y] = outline
-        elif x == 55:
-            pixels[x, y] = outline
-        else:
-            pixels[x, y] = slide_color
-
-# Muzzle opening
-pixels[55, 7] = barrel_dark
-pixels[55, 8] = barrel_dark
-pixels[55, 9] = barrel_dark
-
-# Front sight
-pixels[50, 3] = outline
-pixels[50, 4] = slide_light
-pixels[51, 3] = outline
-pixels[51, 4] = slide_light
-
-# Rear sight
-pixels[12, 3] = outline
-pixels[12, 4] = slide_light
-pixels[13, 3] = outline
-pixels[13, 4] = slide_light
-
-# Ejection port
-for x in range(28, 36):
-    pixels[x, 5] = barrel_dark
-    pixels[x, 6] = (55, 55, 55, 255)
-
-# Frame/lower receiver - x: 10-42, y: 11-14
-for x in range(10, 43):
-    for y in range(11, 15):
-        if y == 14:
-            pixels[x, y] = outline
-        elif x == 10 or x == 42:
-            pixels[x, y] = outline
-        else:
-            pixels[x, y] = frame_color
-
-# Trigger guard - x: 22-32, y: 14-18
-for x in range(22, 33):
-    if x == 22 or x == 32:
-        for y in range(14, 19):
-            pixels[x, y] = outline
+# Each region is painted fill first, then shading rows, then outline
+SPEC = [
+    # Slide (upper part) - x: 10-50, y: 4-11
+    ('rect', (10, 4, 51, 12), slide_color),
+    ('rect', (10, 5, 51, 6), slide_top),
+    ('rect', (10, 6, 51, 7), slide_light),
+    ('rect', (10, 9, 51, 11), barrel_dark),
+    ('outline', (10, 4, 51, 12), outline),
+
+    # Barrel protrusion (front of slide) - x: 48-55, y: 6-10
+    ('rect', (48, 6, 56, 11), slide_color),
+    ('rect', (48, 6, 56, 7), outline),
+    ('rect', (48, 10, 56, 11), outline),
+    ('rect', (55, 6, 56, 11), outline),
+
+    # Muzzle opening
+    ('rect', (55, 7, 56, 10), barrel_dark),
+
+    # Front sight
+    ('rect', (50, 3, 52, 4), outline),
+    ('rect', (50, 4, 52, 5), slide_light),
+
+    # Rear sight
+    ('rect', (12, 3, 14, 4), outline),
+    ('rect', (12, 4, 14, 5), slide_light),
+
+    # Ejection port
+    ('rect', (28, 5, 36, 6), barrel_dark),
+    ('rect', (28, 6, 36, 7), (55, 55, 55, 255)),
+
+    # Frame/lower receiver - x: 10-42, y: 11-14
+    ('rect', (10, 11, 43, 15), frame_color),
+    ('rect', (10, 14, 43, 15), outline),
+    ('rect', (10, 11, 11, 15), outline),
+    ('rect', (42, 11, 43, 15), outline),
+
+    # Trigger guard - x: 22-32, y: 14-18
+    ('rect', (23, 14, 32, 15), trigger_guard),
+    ('rect', (23, 18, 32, 19), outline),
+    ('rect', (22, 14, 23, 19), outline),
+    ('rect', (32, 14, 33, 19), outline),
+
+    # Trigger
+    ('rect', (27, 14, 28, 18), outline),
+
+    # Grip - x: 10-22, y: 14-22
+    ('rect', (11, 14, 22, 15), grip_dark),
+    ('checker', (11, 15, 22, 22), (grip_dark, grip_color)),
+    ('rect', (10, 22, 23, 23), outline),
+    ('rect', (10, 14, 11, 22), outline),
+    ('rect', (22, 14, 23, 18), outline),
+
+    # Magazine base plate
+    ('rect', (11, 22, 22, 23), outline),
+    ('rect', (11, 21, 22, 22), (55, 45, 35, 255)),
+
+    # Grip backstrap
+    ('rect', (10, 15, 11, 22), outline),
+    ('rect', (11, 15, 12, 22), grip_light),
+
+    # Hammer at rear of slide
+    ('rect', (11, 3, 12, 4), outline),
+    ('rect', (11, 4, 12, 5), slide_color),
+
+    # Slide serrations (rear)
+    ('rect', (14, 5, 20, 6), barrel_dark, (2, 1)),
+]
+
+# Cache key for the outputs of this sprite, shared with generate_all_sprites.py
+CACHE_KEY = spec_key(SIZE, SPEC)
+
+
+def create_makarov_icon():
+    """Render the 60x24 side-view Makarov PM armory icon."""
+    return build(SIZE, SPEC)
+
+
+if __name__ == '__main__':
+    output_path = '/tmp/gh-issue-solver-1770470615069/assets/sprites/weapons/makarov_pm_icon.png'
+    if is_up_to_date([output_path], CACHE_KEY):
+        print(f"Icon is up to date: {output_path}")
     else:
-        pixels[x, 14] = trigger_guard
-        pixels[x, 18] = outline
-
-# Trigger
-pixels[27, 14] = outline
-pixels[27, 15] = outline
-pixels[27, 16] = outline
-pixels[27, 17] = outline
-
-# Grip - x: 10-22, y: 14-22
-for x in range(10, 23):
-    for y in range(14, 23):
-        if y == 22:
-            pixels[x, y] = outline
-        elif x == 10:
-            pixels[x, y] = outline
-        elif x == 22:
-            if y < 18:
-                pixels[x, y] = outline
-        elif y == 14:
-            pixels[x, y] = grip_dark
-        else:
-            if x % 2 == 0 and y % 2 == 0:
-                pixels[x, y] = grip_dark
-            elif x % 2 == 1 and y % 2 == 1:
-                pixels[x, y] = grip_dark
-            else:
-                pixels[x, y] = grip_color
-
-# Magazine base plate
-for x in range(11, 22):
-    pixels[x, 22] = outline
-    pixels[x, 21] = (55, 45, 35, 255)
-
-# Grip backstrap
-for y in range(15, 22):
-    pixels[10, y] = outline
-    pixels[11, y] = grip_light
-
-# Hammer at rear of slide
-pixels[11, 3] = outline
-pixels[11, 4] = slide_color
-
-# Slide serrations (rear)
-for x in range(14, 20):
-    if x % 2 == 0:
-        pixels[x, 5] = barrel_dark
-
-# Save
-output_path = '/tmp/gh-issue-solver-1770470615069/assets/sprites/weapons/makarov_pm_icon.png'
-img.save(output_path)
-print(f"Icon saved to {output_path}")
-print(f"Size: {width}x{height}")
+        img = create_makarov_icon()
+
+        # Save
+        save_png(img, [output_path])
+        mark_up_to_date([output_path], CACHE_KEY)
+        print(f"Icon saved to {output_path}")
+        print(f"Size: {SIZE[0]}x{SIZE[1]}")
@@ -3,13 +3,10 @@ Create a simple top-down pixel art sprite for the Makarov PM pistol.
 The sprite should match the style of the existing silenced_pistol_topdown.png
 but be shorter (no suppressor) and represent a compact Soviet pistol.
 """
-from PIL import Image
+from sprite_gen import build, spec_key, is_up_to_date, mark_up_to_date, save_png
 
 # Create a 30x12 image (shorter than silenced pistol's 44x12 since no suppressor)
-width, height = 30, 12
-img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-
-pixels = img.load()
+SIZE = (30, 12)
 
 # Colors for a simple top-down pistol (dark steel/gunmetal)
 barrel_dark = (60, 60, 60, 255)      # Dark steel for barrel
@@ -24,81 +21,72 @@ outline = (40, 40, 40, 255)          # Outline
 
 # Draw the Makarov PM from top-down view (pointing right)
 # The pistol is viewed from above: barrel at right, grip at left-center
+SPEC = [
+    # Barrel (x: 20-29, y: 4-7) - the muzzle end
+    ('rect', (20, 4, 29, 5), outline),
+    ('rect', (20, 5, 29, 6), slide_light),
+    ('rect', (20, 6, 29, 7), slide_color),
+    ('rect', (20, 7, 29, 8), outline),
+
+    # Muzzle tip
+    ('rect', (29, 5, 30, 7), outline),
+
+    # Slide / upper receiver (x: 8-20, y: 3-8)
+    ('rect', (9, 4, 21, 6), slide_light),
+    ('rect', (9, 6, 21, 8), slide_color),
+    ('rect', (8, 3, 21, 4), outline),
+    ('rect', (8, 8, 21, 9), outline),
+    ('rect', (8, 3, 9, 9), outline),
+
+    # Ejection port (top of slide, visible from top-down)
+    ('rect', (14, 4, 19, 5), barrel_dark),
+    ('rect', (14, 5, 19, 6), (55, 55, 55, 255)),
+
+    # Grip (x: 2-10, y: 2-9) - wider part where hand holds
+    ('rect', (3, 2, 10, 3), outline),
+    ('rect', (3, 9, 10, 10), outline),
+    ('rect', (2, 3, 3, 9), outline),
+    ('rect', (3, 3, 8, 9), grip_light),
+    ('rect', (3, 3, 8, 4), grip_dark),
+    ('rect', (3, 8, 8, 9), grip_dark),
+    ('rect', (3, 4, 8, 5), grip_color),
+    ('rect', (3, 7, 8, 8), grip_color),
+
+    # Grip texture lines (bakelite grip panels)
+    ('rect', (4, 4, 7, 8), grip_dark, (2, 2)),
+
+    # Trigger guard area (x: 8-12, y: 8-9)
+    ('rect', (9, 8, 13, 9), trigger_guard),
+
+    # Front sight at muzzle
+    ('rect', (28, 5, 29, 7), (90, 90, 90, 255)),
+
+    # Rear sight
+    ('rect', (9, 4, 10, 5), (90, 90, 90, 255)),
+    ('rect', (9, 7, 10, 8), (90, 90, 90, 255)),
+
+    # Magazine base plate visible at bottom of grip
+    ('rect', (3, 9, 7, 10), (55, 45, 35, 255)),
+]
+
+# Cache key for the outputs of this sprite, shared with generate_all_sprites.py
+CACHE_KEY = spec_key(SIZE, SPEC)
+
+
+def create_makarov_sprite():
+    """Render the 30x12 top-down Makarov PM sprite."""
+    return build(SIZE, SPEC)
+
+
+if __name__ == '__main__':
+    output_path = '/tmp/gh-issue-solver-1770470615069/assets/sprites/weapons/makarov_pm_topdown.png'
+    if is_up_to_date([output_path], CACHE_KEY):
+        print(f"Sprite is up to date: {output_path}")
+    else:
+        img = create_makarov_sprite()
 
-# Barrel (x: 20-29, y: 4-7) - the muzzle end
-for x in range(20, 29):
-    for y in range(4, 8):
-        if y == 4 or y == 7:
-            pixels[x, y] = outline
-        elif y == 5:
-            pixels[x, y] = slide_light
-        else:
-            pixels[x, y] = slide_color
-
-# Muzzle tip
-pixels[29, 5] = outline
-pixels[29, 6] = outline
-
-# Slide / upper receiver (x: 8-20, y: 3-8)
-for x in range(8, 21):
-    for y in range(3, 9):
-        if y == 3 or y == 8:
-            pixels[x, y] = outline
-        elif x == 8:
-            pixels[x, y] = outline
-        elif y == 4:
-            pixels[x, y] = slide_light
-        elif y == 7:
-            pixels[x, y] = slide_color
-        else:
-            pixels[x, y] = slide_color if y > 5 else slide_light
-
-# Ejection port (top of slide, visible from top-down)
-for x in range(14, 19):
-    pixels[x, 4] = barrel_dark
-    pixels[x, 5] = (55, 55, 55, 255)
-
-# Grip (x: 2-10, y: 2-9) - wider part where hand holds
-for x in range(2, 10):
-    for y in range(2, 10):
-        if y == 2 or y == 9:
-            if 3 <= x <= 9:
-                pixels[x, y] = outline
-        elif x == 2:
-            if 3 <= y <= 8:
-                pixels[x, y] = outline
-        elif x <= 7:
-            if y == 3 or y == 8:
-                pixels[x, y] = grip_dark
-            elif y in (4, 7):
-                pixels[x, y] = grip_color
-            else:
-                pixels[x, y] = grip_light
-
-# Grip texture lines (bakelite grip panels)
-for y in range(4, 8):
-    if y % 2 == 0:
-        pixels[4, y] = grip_dark
-        pixels[6, y] = grip_dark
-
-# Trigger guard area (x: 8-12, y: 8-9)
-for x in range(9, 13):
-    pixels[x, 8] = trigger_guard
-
-# Front sight at muzzle
-pixels[28, 5] = (90, 90, 90, 255)
-pixels[28, 6] = (90, 90, 90, 255)
-
-# Rear sight
-pixels[9, 4] = (90, 90, 90, 255)
-pixels[9, 7] = (90, 90, 90, 255)
-
-# Magazine base plate visible at bottom of grip
-for x in range(3, 7):
-    pixels[x, 9] = (55, 45, 35, 255)
-
-# Save the sprite
-output_path = '/tmp/gh-issue-solver-1770470615069/assets/sprites/weapons/makarov_pm_topdown.png'
-img.save(output_path)
-print(f"Sprite saved to {output_path}")
-print(f"Size: {width}x{height}")
+        # Save the sprite
+        save_png(img, [output_path])
+        mark_up_to_date([output_path], CACHE_KEY)
+        print(f"Sprite saved to {output_path}")
+        print(f"Size: {SIZE[0]}x{SIZE[1]}")
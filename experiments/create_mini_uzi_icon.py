@@ -13,178 +13,149 @@ not like a full-sized assault rifle. Short barrel, narrow body.
 Style matches existing weapon sprites (shotgun, M16).
 """
 
-from PIL import Image, ImageDraw
-
-# Color palette matching other weapon sprites
-COLORS = {
-    'black': (30, 30, 30, 255),
-    'dark_gray': (45, 45, 45, 255),
-    'medium_gray': (60, 60, 60, 255),
-    'light_gray': (70, 70, 70, 255),
-    'lighter_gray': (90, 90, 90, 255),
-    'highlight': (100, 100, 100, 255),
-    'metal_dark': (35, 35, 40, 255),
-    'metal_medium': (50, 50, 55, 255),
-    'metal_light': (70, 70, 75, 255),
-    'transparent': (0, 0, 0, 0),
-}
+import numpy as np
+import sys
 
+from sprite_gen import build, spec_key, is_up_to_date, mark_up_to_date, save_png
+from sprite_gen import WEAPON_COLORS as COLORS
 
-def create_mini_uzi_icon():
-    """
-    Create 60x18 side-view Mini UZI icon matching reference photos.
 
-    Issue #530 feedback: UZI is a submachine gun (slightly larger than a pistol),
-    current icon looks like a full-sized assault rifle. Must be compact and stubby.
+SIZE = (60, 18)
 
-    Key design decisions:
-    - Stock is FOLDED (shown as small bump on the left) - makes it compact
-    - Receiver body is the dominant feature (~40% of visible weapon)
-    - Barrel shroud is VERY short (~15% of visible weapon)
-    - Muzzle barely extends beyond shroud
-    - Overall weapon occupies only about 35px of the 60px canvas (compact)
-    - Prominent pistol grip with magazine (defining UZI feature)
+# Palette entries used by the spec below
+black = COLORS['black']
+dark_gray = COLORS['dark_gray']
+lighter_gray = COLORS['lighter_gray']
+metal_dark = COLORS['metal_dark']
+metal_medium = COLORS['metal_medium']
+metal_light = COLORS['metal_light']
 
-    Proportions (within 60x18 canvas, weapon centered):
-    - Folded stock bump: ~4px
-    - Receiver body: ~16px (dominant)
-    - Barrel shroud: ~6px (very short)
-    - Muzzle: ~2px
-    - Total weapon width: ~28px (compact, leaves padding on both sides)
-    """
-    width, height = 60, 18
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
+# Center the weapon horizontally in the 60px canvas
+# Weapon is about 28px wide, offset from left by ~16px to center it
+ox = 16  # horizontal offset for centering
+
+# Receiver body: x: ox+3 to ox+18 (16px wide) - this is the main body
+rx_start = ox + 3
+rx_end = ox + 19  # exclusive
+
+# Grip at the center of the receiver; 5px wide rows shifted back one pixel
+# every 3 rows (slight backward angle)
+grip_cx = rx_start + 6  # center of grip
+grip_rows = np.arange(10, 16)
+grip_cols = grip_cx - 2 - (grip_rows[:, None] - 10) // 3 + np.arange(5)
+tex_rows = np.array([11, 13])
+tex_cols = grip_cx - 1 - (tex_rows[:, None] - 10) // 3 + np.arange(3)
 
-    # Center the weapon horizontally in the 60px canvas
-    # Weapon is about 28px wide, offset from left by ~16px to center it
-    ox = 16  # horizontal offset for centering
+# Trigger guard just ahead of the grip
+tg_start = grip_cx + 3
+tg_end = tg_start + 4
 
+# Barrel shroud: x: rx_end to rx_end+5 (6px) - much shorter than receiver
+bx_start = rx_end
+bx_end = rx_end + 6
+
+# Muzzle just past the shroud
+mx = bx_end
+
+SPEC = [
     # === FOLDED STOCK (small bump on left) - compact, not extended ===
     # When folded, the stock sits on top/alongside the receiver as a small element
     # Just a small plate visible at the back
-    for y in range(4, 8):
-        img.putpixel((ox + 0, y), COLORS['metal_dark'])
-        img.putpixel((ox + 1, y), COLORS['metal_dark'])
+    ('rect', (ox, 4, ox + 2, 8), metal_dark),
     # Stock hinge pin
-    img.putpixel((ox + 2, 5), COLORS['lighter_gray'])
-    img.putpixel((ox + 2, 6), COLORS['lighter_gray'])
+    ('rect', (ox + 2, 5, ox + 3, 7), lighter_gray),
 
     # === RECEIVER BODY (tall, boxy - DOMINANT section) ===
-    # x: ox+3 to ox+18 (16px wide) - this is the main body
-    rx_start = ox + 3
-    rx_end = ox + 19  # exclusive
-
-    # Top edge of receiver
-    for x in range(rx_start, rx_end):
-        img.putpixel((x, 3), COLORS['black'])
-    # Bottom edge of receiver
-    for x in range(rx_start, rx_end):
-        img.putpixel((x, 9), COLORS['black'])
-    # Left/right edges
-    for y in range(3, 10):
-        img.putpixel((rx_start, y), COLORS['black'])
-        img.putpixel((rx_end - 1, y), COLORS['black'])
-    # Fill receiver body
-    for y in range(4, 9):
-        for x in range(rx_start + 1, rx_end - 1):
-            if y <= 4:
-                img.putpixel((x, y), COLORS['metal_dark'])
-            elif y >= 8:
-                img.putpixel((x, y), COLORS['metal_dark'])
-            else:
-                img.putpixel((x, y), COLORS['metal_medium'])
-
+    ('outline', (rx_start, 3, rx_end, 10), black),
+    # Fill receiver body, darker along the top and bottom rows
+    ('rect', (rx_start + 1, 4, rx_end - 1, 9), metal_medium),
+    ('rect', (rx_start + 1, 4, rx_end - 1, 5), metal_dark),
+    ('rect', (rx_start + 1, 8, rx_end - 1, 9), metal_dark),
     # Receiver details: ejection port / cocking slot
-    for x in range(rx_start + 3, rx_start + 10):
-        img.putpixel((x, 5), COLORS['lighter_gray'])
+    ('rect', (rx_start + 3, 5, rx_start + 10, 6), lighter_gray),
     # Cocking handle knob
-    img.putpixel((rx_start + 6, 4), COLORS['lighter_gray'])
-
+    ('pixels', (rx_start + 6, 4), lighter_gray),
     # Rear sight nub on top
-    img.putpixel((rx_start + 2, 2), COLORS['black'])
-    img.putpixel((rx_start + 3, 2), COLORS['black'])
-
+    ('rect', (rx_start + 2, 2, rx_start + 4, 3), black),
     # Front sight on top of receiver (near front)
-    img.putpixel((rx_end - 3, 2), COLORS['black'])
-    img.putpixel((rx_end - 2, 2), COLORS['black'])
+    ('rect', (rx_end - 3, 2, rx_end - 1, 3), black),
 
     # === PISTOL GRIP + MAGAZINE (below receiver) ===
     # UZI's defining feature: magazine inside the pistol grip
-    # Grip at the center of the receiver
-    grip_cx = rx_start + 6  # center of grip
-    for y in range(10, 16):
-        offset = (y - 10) // 3  # slight backward angle
-        gx_start = grip_cx - 2 - offset
-        gx_end = grip_cx + 2 - offset
-        for x in range(gx_start, gx_end + 1):
-            if x == gx_start or x == gx_end or y == 15:
-                img.putpixel((x, y), COLORS['black'])
-            else:
-                img.putpixel((x, y), COLORS['dark_gray'])
+    ('pixels', (grip_cols, grip_rows[:, None]), dark_gray),
+    ('pixels', (grip_cols[:, 0], grip_rows), black),
+    ('pixels', (grip_cols[:, -1], grip_rows), black),
+    ('pixels', (grip_cols[-1], 15), black),
     # Magazine base plate (slightly wider at bottom)
-    for x in range(grip_cx - 3 - 1, grip_cx + 2 - 1):
-        img.putpixel((x, 16), COLORS['black'])
-
+    ('rect', (grip_cx - 4, 16, grip_cx + 1, 17), black),
     # Grip texture lines (horizontal)
-    for y in [11, 13]:
-        offset = (y - 10) // 3
-        for x in range(grip_cx - 1 - offset, grip_cx + 2 - offset):
-            img.putpixel((x, y), COLORS['metal_dark'])
+    ('pixels', (tex_cols, tex_rows[:, None]), metal_dark),
 
     # === TRIGGER GUARD ===
-    tg_start = grip_cx + 3
-    tg_end = tg_start + 4
-    for x in range(tg_start, tg_end):
-        img.putpixel((x, 12), COLORS['black'])
-    img.putpixel((tg_start, 10), COLORS['black'])
-    img.putpixel((tg_start, 11), COLORS['black'])
-    img.putpixel((tg_end - 1, 10), COLORS['black'])
-    img.putpixel((tg_end - 1, 11), COLORS['black'])
+    ('rect', (tg_start, 12, tg_end, 13), black),
+    ('rect', (tg_start, 10, tg_start + 1, 12), black),
+    ('rect', (tg_end - 1, 10, tg_end, 12), black),
     # Trigger
-    img.putpixel((tg_start + 1, 10), COLORS['metal_dark'])
-    img.putpixel((tg_start + 1, 11), COLORS['metal_dark'])
+    ('rect', (tg_start + 1, 10, tg_start + 2, 12), metal_dark),
 
     # === BARREL SHROUD (very short, thicker) ===
-    # x: rx_end to rx_end+5 (6px) - much shorter than receiver
     # The shroud is cylindrical and thick (almost as tall as receiver mid-section)
-    bx_start = rx_end
-    bx_end = rx_end + 6
-
     # Top and bottom edges of shroud
-    for x in range(bx_start, bx_end):
-        img.putpixel((x, 4), COLORS['black'])
-        img.putpixel((x, 9), COLORS['black'])
+    ('rect', (bx_start, 4, bx_end, 5), black),
+    ('rect', (bx_start, 9, bx_end, 10), black),
     # Fill barrel shroud body (4px tall - substantial cylinder)
-    for y in range(5, 9):
-        for x in range(bx_start, bx_end):
-            img.putpixel((x, y), COLORS['metal_medium'])
-
+    ('rect', (bx_start, 5, bx_end, 9), metal_medium),
     # Ribbing/grooves on barrel shroud (vertical lines for texture)
-    for x in range(bx_start + 1, bx_end - 1, 2):
-        for y in range(5, 9):
-            img.putpixel((x, y), COLORS['metal_dark'])
+    ('rect', (bx_start + 1, 5, bx_end - 1, 9), metal_dark, (2, 1)),
 
     # === MUZZLE / BARREL TIP (barely extends) ===
     # Just 2 pixels past the shroud
-    mx = bx_end
-    for y in range(5, 9):
-        img.putpixel((mx, y), COLORS['black'])
-    img.putpixel((mx + 1, 6), COLORS['metal_light'])
-    img.putpixel((mx + 1, 7), COLORS['metal_light'])
+    ('rect', (mx, 5, mx + 1, 9), black),
+    ('rect', (mx + 1, 6, mx + 2, 8), metal_light),
+]
+
+# Cache key for the outputs of this sprite, shared with generate_all_sprites.py
+CACHE_KEY = spec_key(SIZE, SPEC)
 
-    return img
+
+def create_mini_uzi_icon():
+    """
+    Create 60x18 side-view Mini UZI icon matching reference photos.
+
+    Issue #530 feedback: UZI is a submachine gun (slightly larger than a pistol),
+    current icon looks like a full-sized assault rifle. Must be compact and stubby.
+
+    Key design decisions:
+    - Stock is FOLDED (shown as small bump on the left) - makes it compact
+    - Receiver body is the dominant feature (~40% of visible weapon)
+    - Barrel shroud is VERY short (~15% of visible weapon)
+    - Muzzle barely extends beyond shroud
+    - Overall weapon occupies only about 35px of the 60px canvas (compact)
+    - Prominent pistol grip with magazine (defining UZI feature)
+
+    Proportions (within 60x18 canvas, weapon centered):
+    - Folded stock bump: ~4px
+    - Receiver body: ~16px (dominant)
+    - Barrel shroud: ~6px (very short)
+    - Muzzle: ~2px
+    - Total weapon width: ~28px (compact, leaves padding on both sides)
+    """
+    return build(SIZE, SPEC)
 
 
 if __name__ == '__main__':
+    outputs = ['experiments/mini_uzi_icon.png', 'assets/sprites/weapons/mini_uzi_icon.png']
+    if is_up_to_date(outputs, CACHE_KEY):
+        print("mini_uzi_icon.png is up to date, nothing to do")
+        sys.exit(0)
+
     # Create sprite
     icon = create_mini_uzi_icon()
 
-    # Save to experiments folder first
-    icon.save('experiments/mini_uzi_icon.png')
+    # Save to experiments folder first, then copy the file to assets
+    save_png(icon, outputs)
     print(f"Created mini_uzi_icon.png: {icon.size}")
-
-    # Also save to assets folder
-    icon.save('assets/sprites/weapons/mini_uzi_icon.png')
+    mark_up_to_date(outputs, CACHE_KEY)
 
     print("\nSprite saved to:")
     print("  - experiments/mini_uzi_icon.png")
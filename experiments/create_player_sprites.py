@@ -28,15 +28,31 @@ COLORS = {
     'black': (20, 20, 20, 255),           # Near black
 }
 
+
+def pattern_to_image(pattern, color_map, width, height):
+    """
+    Rasterize a character pattern into a width x height RGBA image.
+
+    The whole pixel list is built up front and handed to Pillow in a single
+    putdata() call. Characters missing from color_map, and any area the
+    pattern does not cover, stay transparent.
+    """
+    transparent = COLORS['transparent']
+    data = []
+    for y in range(height):
+        row = pattern[y][:width] if y < len(pattern) else ''
+        data.extend(color_map.get(char, transparent) for char in row.ljust(width))
+    img = Image.new('RGBA', (width, height))
+    img.putdata(data)
+    return img
+
+
 def create_body_sprite():
     """
     Create the main body/torso sprite - 16x20 pixels.
     Top-down view shows shoulders and torso from above.
     """
     width, height = 16, 20
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
-    pixels = img.load()
-
     # Body shape - oval torso from top-down
     body_pattern = [
         # Row 0-2: Top of torso (back/neck area)
@@ -72,12 +88,7 @@ def create_body_sprite():
         'G': COLORS['dark_green'],
     }
 
-    for y, row in enumerate(body_pattern):
-        for x, char in enumerate(row[:width]):  # Ensure we don't exceed width
-            if char in color_map:
-                pixels[x, y] = color_map[char]
-
-    return img
+    return pattern_to_image(body_pattern, color_map, width, height)
 
 
 def create_head_sprite():
@@ -86,9 +97,6 @@ def create_head_sprite():
     Top-down view shows helmet from above.
     """
     width, height = 12, 10
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
-    pixels = img.load()
-
     # Helmet shape from above
     head_pattern = [
         "    gggg    ",  # row 0
@@ -109,12 +117,7 @@ def create_head_sprite():
         'G': COLORS['dark_green'],
     }
 
-    for y, row in enumerate(head_pattern):
-        for x, char in enumerate(row[:width]):
-            if char in color_map:
-                pixels[x, y] = color_map[char]
-
-    return img
+    return pattern_to_image(head_pattern, color_map, width, height)
 
 
 def create_left_arm_sprite():
@@ -123,9 +126,6 @@ def create_left_arm_sprite():
     Shows arm from top-down view, extended forward for holding position.
     """
     width, height = 6, 14
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
-    pixels = img.load()
-
     # Left arm from top-down (slightly bent forward)
     arm_pattern = [
         "  gg  ",  # row 0 - shoulder attachment
@@ -151,12 +151,7 @@ def create_left_arm_sprite():
         's': COLORS['skin'],
     }
 
-    for y, row in enumerate(arm_pattern):
-        for x, char in enumerate(row[:width]):
-            if char in color_map:
-                pixels[x, y] = color_map[char]
-
-    return img
+    return pattern_to_image(arm_pattern, color_map, width, height)
 
 
 def create_right_arm_sprite():
@@ -165,9 +160,6 @@ def create_right_arm_sprite():
     Mirror of left arm but can be animated separately for reload.
     """
     width, height = 6, 14
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
-    pixels = img.load()
-
     # Right arm from top-down (slightly bent forward) - mirrored
     arm_pattern = [
         "  gg  ",  # row 0 - shoulder attachment
@@ -193,12 +185,7 @@ def create_right_arm_sprite():
         's': COLORS['skin'],
     }
 
-    for y, row in enumerate(arm_pattern):
-        for x, char in enumerate(row[:width]):
-            if char in color_map:
-                pixels[x, y] = color_map[char]
-
-    return img
+    return pattern_to_image(arm_pattern, color_map, width, height)
 
 
 def create_combined_sprite():
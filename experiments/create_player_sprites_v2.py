@@ -37,15 +37,30 @@ COLORS = {
 }
 
 
+def pattern_to_image(pattern, color_map, width, height):
+    """
+    Rasterize a character pattern into a width x height RGBA image.
+
+    The whole pixel list is built up front and handed to Pillow in a single
+    putdata() call. Characters missing from color_map, and any area the
+    pattern does not cover, stay transparent.
+    """
+    transparent = COLORS['transparent']
+    data = []
+    for y in range(height):
+        row = pattern[y][:width] if y < len(pattern) else ''
+        data.extend(color_map.get(char, transparent) for char in row.ljust(width))
+    img = Image.new('RGBA', (width, height))
+    img.putdata(data)
+    return img
+
+
 def create_body_sprite():
     """
     Create the main body/torso sprite - 24x28 pixels.
     Top-down view shows shoulders, tactical vest, and torso from above.
     """
     width, height = 24, 28
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
-    pixels = img.load()
-
     # Body pattern - more detailed tactical vest appearance
     # Characters: . = transparent, D = dark_green, G = green, L = light_green
     #             d = dark_gray, g = gray, l = light_gray, B = brown, b = dark_brown
@@ -99,12 +114,7 @@ def create_body_sprite():
         'b': COLORS['dark_brown'],
     }
 
-    for y, row in enumerate(body_pattern):
-        for x, char in enumerate(row[:width]):
-            if char in color_map:
-                pixels[x, y] = color_map[char]
-
-    return img
+    return pattern_to_image(body_pattern, color_map, width, height)
 
 
 def create_head_sprite():
@@ -113,9 +123,6 @@ def create_head_sprite():
     Top-down view shows helmet from above with slight 3D depth.
     """
     width, height = 18, 14
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
-    pixels = img.load()
-
     # Helmet pattern with depth shading
     head_pattern = [
         "......LLLLLL......",  # 0 - top highlight
@@ -141,12 +148,7 @@ def create_head_sprite():
         'L': COLORS['light_green'],
     }
 
-    for y, row in enumerate(head_pattern):
-        for x, char in enumerate(row[:width]):
-            if char in color_map:
-                pixels[x, y] = color_map[char]
-
-    return img
+    return pattern_to_image(head_pattern, color_map, width, height)
 
 
 def create_left_arm_sprite():
@@ -155,9 +157,6 @@ def create_left_arm_sprite():
     Top-down view showing arm extended forward (holding position).
     """
     width, height = 8, 20
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
-    pixels = img.load()
-
     # Left arm - extended forward for weapon holding
     arm_pattern = [
         "..GGL...",  # 0 - shoulder attachment
@@ -192,12 +191,7 @@ def create_left_arm_sprite():
         'S': COLORS['skin'],
     }
 
-    for y, row in enumerate(arm_pattern):
-        for x, char in enumerate(row[:width]):
-            if char in color_map:
-                pixels[x, y] = color_map[char]
-
-    return img
+    return pattern_to_image(arm_pattern, color_map, width, height)
 
 
 def create_right_arm_sprite():
@@ -206,9 +200,6 @@ def create_right_arm_sprite():
     Top-down view, mirror of left arm.
     """
     width, height = 8, 20
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
-    pixels = img.load()
-
     # Right arm - mirrored, extended forward
     arm_pattern = [
         "...LGG..",  # 0
@@ -243,12 +234,7 @@ def create_right_arm_sprite():
         'S': COLORS['skin'],
     }
 
-    for y, row in enumerate(arm_pattern):
-        for x, char in enumerate(row[:width]):
-            if char in color_map:
-                pixels[x, y] = color_map[char]
-
-    return img
+    return pattern_to_image(arm_pattern, color_map, width, height)
 
 
 def create_combined_sprite():
@@ -6,48 +6,122 @@ Issue #447: Add reload animation to shotgun.
 The pump sprite represents the foregrip/pump handle that moves during
 pump-action cycling. It's a small rectangular shape that sits on the
 shotgun barrel.
+
+All three pump iterations are described here as sprite specs and rendered
+with make_pump(); create_pump_sprite_v2.py and create_pump_sprite_v3.py are
+thin wrappers that keep their original output locations.
+
+Usage:
+    python experiments/create_pump_sprite.py [--variant v1|v2|v3]
 """
 
-from PIL import Image, ImageDraw
+import argparse
+import os
 
-def create_pump_sprite():
-    """Create a simple pump/foregrip sprite for the shotgun."""
-    # Pump dimensions (width x height in pixels)
-    # The pump is wider than tall, positioned horizontally along the barrel
-    width = 6
-    height = 8
+from sprite_gen import build, save_png
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSET_PATH = os.path.join(os.path.dirname(SCRIPT_DIR), 'assets', 'sprites', 'weapons', 'shotgun_pump.png')
 
-    # Create image with transparency
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
+def _steel_pump(width, height):
+    """v1: dark steel block, highlight on the top edge, shadow on the bottom."""
     # Main pump body - dark gray metal color
     pump_color = (60, 60, 65, 255)  # Dark gray-blue steel
-    draw.rectangle([0, 0, width-1, height-1], fill=pump_color)
-
     # Highlight on top edge for 3D effect
     highlight_color = (90, 90, 95, 255)
-    draw.line([(0, 0), (width-1, 0)], fill=highlight_color)
-
     # Shadow on bottom edge
     shadow_color = (40, 40, 45, 255)
-    draw.line([(0, height-1), (width-1, height-1)], fill=shadow_color)
+    return [
+        ('rect', (0, 0, width, height), pump_color),
+        ('rect', (0, 0, width, 1), highlight_color),
+        ('rect', (0, height - 1, width, height), shadow_color),
+    ]
+
+
+# v2 colors extracted from shotgun_topdown.png wooden elements
+# The wooden stock has colors ranging from dark brown to medium brown
+WOOD_DARK = (89, 54, 24)      # Dark brown edge
+WOOD_MAIN = (139, 90, 43)     # Main brown color
+WOOD_LIGHT = (165, 115, 55)   # Lighter brown highlight
+
+
+def _wood_pump(width, height):
+    """v2: wood block matching the stock, dark sides/bottom, light top rows."""
+    wood_dark = WOOD_DARK + (255,)
+    wood_main = WOOD_MAIN + (255,)
+    wood_light = WOOD_LIGHT + (255,)
+    return [
+        ('rect', (0, 0, width, height), wood_main),
+        # Left and right edges: darker
+        ('rect', (0, 0, 1, height), wood_dark),
+        ('rect', (width - 1, 0, width, height), wood_dark),
+        # Top edge lighter, bottom edge darker
+        ('rect', (0, 0, width, 1), wood_light),
+        ('rect', (0, height - 1, width, height), wood_dark),
+        # Subtle highlight line near the top
+        ('rect', (1, 1, width - 1, 2), wood_light),
+    ]
+
+
+def _rounded_pump(width, height):
+    """v3: volumetric #533b23 body with darkened edges and rounded ends."""
+    main_color = (0x53, 0x3b, 0x23, 255)  # #533b23 - main brown
+    dark_edge = (0x3a, 0x28, 0x17, 255)   # Darker brown for edges (~30% darker)
+    highlight = (0x6a, 0x4d, 0x2d, 255)   # Lighter brown for highlight (~20% lighter)
+    # Main body (all but 2 pixels on each end): two dark rows at the top and
+    # bottom, main color between them, highlight on the middle rows for roundness
+    spec = [
+        ('rect', (2, 0, width - 2, height), dark_edge),
+        ('rect', (2, 2, width - 2, height - 2), main_color),
+        ('rect', (2, height // 2 - 1, width - 2, height // 2 + 1), highlight),
+    ]
+    # Rounded ends: the outer column stops one row short of the inner one and
+    # the top/bottom rows stay transparent, which rounds off the corners
+    for x_outer, x_inner in ((0, 1), (width - 1, width - 2)):
+        spec += [
+            ('rect', (x_inner, 1, x_inner + 1, height - 1), dark_edge),
+            ('rect', (x_inner, 2, x_inner + 1, height - 2), main_color),
+            ('rect', (x_outer, 2, x_outer + 1, height - 2), dark_edge),
+        ]
+    return spec
+
+
+# variant -> ((width, height), spec builder, reference copy in experiments/)
+PUMP_VARIANTS = {
+    'v1': ((6, 8), _steel_pump, 'shotgun_pump.png'),
+    'v2': ((12, 8), _wood_pump, 'shotgun_pump_v2.png'),   # 2x longer, wood colour
+    'v3': ((20, 8), _rounded_pump, os.path.join('sprites', 'shotgun_pump_v3.png')),
+}
+
+
+def make_pump(variant='v1'):
+    """Render one of the PUMP_VARIANTS."""
+    size, style, _ = PUMP_VARIANTS[variant]
+    return build(size, style(*size))
+
+
+def create_pump_sprite():
+    """Create a simple pump/foregrip sprite for the shotgun."""
+    return make_pump('v1')
 
-    return img
 
 def main():
+    parser = argparse.ArgumentParser(description="Create the shotgun pump sprite.")
+    parser.add_argument('--variant', choices=sorted(PUMP_VARIANTS), default='v1')
+    args = parser.parse_args()
+
     # Create pump sprite
-    pump = create_pump_sprite()
+    pump = make_pump(args.variant)
 
-    # Save to assets folder
-    output_path = '../assets/sprites/weapons/shotgun_pump.png'
-    pump.save(output_path)
-    print(f"Created pump sprite: {output_path}")
+    # Save to assets folder, and copy the file to experiments for reference
+    reference = os.path.join(SCRIPT_DIR, PUMP_VARIANTS[args.variant][2])
+    os.makedirs(os.path.dirname(reference), exist_ok=True)
+    save_png(pump, [ASSET_PATH, reference])
+    print(f"Created pump sprite: {ASSET_PATH}")
     print(f"Size: {pump.size[0]}x{pump.size[1]} pixels")
+    print(f"Also saved to {os.path.relpath(reference, os.path.dirname(SCRIPT_DIR))}")
 
-    # Also save to experiments folder for reference
-    pump.save('shotgun_pump.png')
-    print("Also saved to experiments/shotgun_pump.png")
 
 if __name__ == '__main__':
     main()
@@ -13,46 +13,17 @@ in a top-down 2D game.
 from PIL import Image
 import os
 
+from create_pump_sprite import make_pump, WOOD_DARK, WOOD_MAIN, WOOD_LIGHT
+
 # Output paths
 OUTPUT_DIR = "/tmp/gh-issue-solver-1770215589225/assets/sprites/weapons"
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "shotgun_pump.png")
 BACKUP_FILE = os.path.join(OUTPUT_DIR, "shotgun_pump_old.png")
 
-# Dimensions: 2x longer than original 6x8
-WIDTH = 12  # 2x the original 6
-HEIGHT = 8
-
-# Colors extracted from shotgun_topdown.png wooden elements
-# The wooden stock has colors ranging from dark brown to medium brown
-WOOD_DARK = (89, 54, 24)      # Dark brown edge
-WOOD_MAIN = (139, 90, 43)     # Main brown color
-WOOD_LIGHT = (165, 115, 55)   # Lighter brown highlight
-
-# Create new image with transparency
-img = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
-pixels = img.load()
-
-# Fill with main wood color, add simple shading
-for y in range(HEIGHT):
-    for x in range(WIDTH):
-        # Top edge (y=0): lighter
-        if y == 0:
-            color = WOOD_LIGHT + (255,)
-        # Bottom edge (y=7): darker
-        elif y == HEIGHT - 1:
-            color = WOOD_DARK + (255,)
-        # Left and right edges: darker
-        elif x == 0 or x == WIDTH - 1:
-            color = WOOD_DARK + (255,)
-        # Main body
-        else:
-            color = WOOD_MAIN + (255,)
-
-        pixels[x, y] = color
-
-# Add a subtle highlight line near the top
-for x in range(1, WIDTH - 1):
-    pixels[x, 1] = WOOD_LIGHT + (255,)
+# Dimensions: 2x longer than original 6x8, colors extracted from the
+# shotgun_topdown.png wooden elements (see PUMP_VARIANTS['v2'])
+img = make_pump('v2')
+WIDTH, HEIGHT = img.size
 
 # Save the image
 os.makedirs(OUTPUT_DIR, exist_ok=True)
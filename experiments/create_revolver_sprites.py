@@ -13,23 +13,11 @@ Style matches existing weapon sprites (shotgun, M16, silenced pistol).
 """
 
 from PIL import Image
+import numpy as np
 
-# Color palette matching other weapon sprites
-COLORS = {
-    'black': (30, 30, 30, 255),
-    'dark_gray': (45, 45, 45, 255),
-    'medium_gray': (60, 60, 60, 255),
-    'light_gray': (70, 70, 70, 255),
-    'lighter_gray': (90, 90, 90, 255),
-    'highlight': (100, 100, 100, 255),
-    'metal_dark': (35, 35, 40, 255),
-    'metal_medium': (50, 50, 55, 255),
-    'metal_light': (70, 70, 75, 255),
-    'grip_dark': (50, 40, 30, 255),
-    'grip_medium': (70, 55, 40, 255),
-    'grip_light': (85, 70, 50, 255),
-    'transparent': (0, 0, 0, 0),
-}
+from sprite_gen import new_canvas, draw_rect, draw_hline, draw_vline, draw_pixels
+from sprite_gen import coord_grid, draw_under, draw_ellipse_bands
+from sprite_gen import WEAPON_COLORS as COLORS
 
 
 def create_revolver_icon():
@@ -45,7 +33,15 @@ def create_revolver_icon():
     - Overall massive proportions
     """
     width, height = 80, 24
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
+    arr = new_canvas(width, height)
+
+    # Bind palette entries to locals once instead of a dict lookup per write
+    black = COLORS['black']
+    dark_gray = COLORS['dark_gray']
+    lighter_gray = COLORS['lighter_gray']
+    metal_dark = COLORS['metal_dark']
+    metal_medium = COLORS['metal_medium']
+    metal_light = COLORS['metal_light']
 
     # Layout (pointing right):
     # [grip] [frame+cylinder] [barrel]
@@ -55,177 +51,109 @@ def create_revolver_icon():
 
     # === BARREL (short, thick for 12.7mm) - x: 50-75, y: 5-11 ===
     # Top rib / barrel shroud
-    for x in range(50, 76):
-        img.putpixel((x, 5), COLORS['black'])
-        img.putpixel((x, 11), COLORS['black'])
-    for y in range(5, 12):
-        img.putpixel((75, y), COLORS['black'])
+    draw_hline(arr, 5, 50, 76, black)
+    draw_hline(arr, 11, 50, 76, black)
+    draw_vline(arr, 75, 5, 12, black)
 
     # Barrel body
-    for y in range(6, 11):
-        for x in range(50, 75):
-            if y == 6:
-                img.putpixel((x, y), COLORS['metal_light'])
-            elif y == 10:
-                img.putpixel((x, y), COLORS['metal_dark'])
-            elif y == 7:
-                img.putpixel((x, y), COLORS['lighter_gray'])
-            else:
-                img.putpixel((x, y), COLORS['metal_medium'])
+    draw_rect(arr, (50, 6, 75, 11), metal_medium)
+    draw_hline(arr, 6, 50, 75, metal_light)
+    draw_hline(arr, 7, 50, 75, lighter_gray)
+    draw_hline(arr, 10, 50, 75, metal_dark)
 
     # Ventilated rib (top of barrel) - small slots
-    for x in range(54, 73, 4):
-        img.putpixel((x, 6), COLORS['dark_gray'])
-        img.putpixel((x + 1, 6), COLORS['dark_gray'])
+    # 2px slots every 4px from x = 54: two strided stores, one per slot column
+    draw_rect(arr, (54, 6, 73, 7), dark_gray, step=(4, 1))
+    draw_rect(arr, (55, 6, 74, 7), dark_gray, step=(4, 1))
 
     # Muzzle opening
-    img.putpixel((75, 7), COLORS['dark_gray'])
-    img.putpixel((75, 8), COLORS['dark_gray'])
-    img.putpixel((75, 9), COLORS['dark_gray'])
+    draw_vline(arr, 75, 7, 10, dark_gray)
 
     # Under-barrel lug / weight
-    for y in range(11, 14):
-        for x in range(50, 68):
-            if y == 13 or x == 50 or x == 67:
-                img.putpixel((x, y), COLORS['black'])
-            else:
-                img.putpixel((x, y), COLORS['metal_dark'])
+    draw_rect(arr, (50, 11, 68, 14), metal_dark)
+    draw_hline(arr, 13, 50, 68, black)
+    draw_vline(arr, 50, 11, 14, black)
+    draw_vline(arr, 67, 11, 14, black)
 
     # Front sight
-    img.putpixel((72, 4), COLORS['black'])
-    img.putpixel((73, 4), COLORS['black'])
-    img.putpixel((72, 5), COLORS['lighter_gray'])
-    img.putpixel((73, 5), COLORS['lighter_gray'])
+    draw_hline(arr, 4, 72, 74, black)
+    draw_hline(arr, 5, 72, 74, lighter_gray)
 
     # === FRAME (upper part above cylinder) - x: 18-50, y: 4-8 ===
-    for y in range(4, 9):
-        for x in range(18, 51):
-            if y == 4 or y == 8:
-                img.putpixel((x, y), COLORS['black'])
-            elif x == 18:
-                img.putpixel((x, y), COLORS['black'])
-            elif y == 5:
-                img.putpixel((x, y), COLORS['metal_light'])
-            else:
-                img.putpixel((x, y), COLORS['metal_medium'])
+    draw_rect(arr, (19, 5, 51, 8), metal_medium)
+    draw_hline(arr, 5, 19, 51, metal_light)
+    draw_hline(arr, 4, 18, 51, black)
+    draw_hline(arr, 8, 18, 51, black)
+    draw_vline(arr, 18, 4, 9, black)
 
     # Rear sight
-    img.putpixel((22, 3), COLORS['black'])
-    img.putpixel((23, 3), COLORS['black'])
-    img.putpixel((24, 3), COLORS['black'])
+    draw_hline(arr, 3, 22, 25, black)
 
     # Hammer (exposed, at rear top)
-    img.putpixel((19, 2), COLORS['black'])
-    img.putpixel((20, 2), COLORS['black'])
-    img.putpixel((19, 3), COLORS['metal_medium'])
-    img.putpixel((20, 3), COLORS['metal_medium'])
-    img.putpixel((19, 4), COLORS['metal_dark'])
-    img.putpixel((20, 4), COLORS['metal_dark'])
+    draw_hline(arr, 2, 19, 21, black)
+    draw_hline(arr, 3, 19, 21, metal_medium)
+    draw_hline(arr, 4, 19, 21, metal_dark)
 
     # === CYLINDER (large, distinctive revolver feature) - x: 28-48, y: 8-16 ===
     # The cylinder is the most distinctive part of a revolver
-    for y in range(8, 17):
-        for x in range(28, 49):
-            # Create rounded cylinder shape
-            cy = 12  # center y
-            cx = 38  # center x
-            ry = 4   # radius y
-            rx = 10  # radius x
-
-            # Check if point is within ellipse
-            dx = (x - cx) / rx
-            dy = (y - cy) / ry
-            dist = dx * dx + dy * dy
-
-            if dist <= 1.0:
-                if dist > 0.75:
-                    img.putpixel((x, y), COLORS['black'])
-                elif dist > 0.6:
-                    img.putpixel((x, y), COLORS['metal_dark'])
-                elif y <= 10:
-                    img.putpixel((x, y), COLORS['metal_light'])
-                elif y >= 14:
-                    img.putpixel((x, y), COLORS['dark_gray'])
-                else:
-                    img.putpixel((x, y), COLORS['metal_medium'])
-
-    # Cylinder flutes (vertical lines showing chambers)
-    for x in [33, 36, 39, 42, 45]:
-        for y in range(9, 16):
-            cy = 12
-            ry = 4
-            dx = (x - 38) / 10
-            dy = (y - cy) / ry
-            if dx * dx + dy * dy < 0.7:
-                img.putpixel((x, y), COLORS['dark_gray'])
+    # Rounded cylinder shape: ellipse centred (38, 12) with radii (10, 4),
+    # lit from above, with a dark rim band inside the outline
+    rows = np.arange(8, 17)[:, None]
+    shade = np.select([rows <= 10, rows >= 14], [metal_light, dark_gray], metal_medium)
+    draw_ellipse_bands(arr, (28, 8, 49, 17), (38, 12), (10, 4), shade[:, None],
+                       [(0.6, metal_dark), (0.75, black)])
+
+    # Cylinder flutes (vertical lines showing chambers) at x = 33, 36, ..., 45
+    fy, fx = np.ogrid[9:16, 33:46:3]
+    dx = (fx - 38) / 10
+    dy = (fy - 12) / 4
+    flutes = arr[9:16, 33:46:3]
+    flutes[dx * dx + dy * dy < 0.7] = dark_gray
 
     # Cylinder pin / axis
-    img.putpixel((38, 8), COLORS['lighter_gray'])
-    img.putpixel((38, 16), COLORS['lighter_gray'])
+    draw_pixels(arr, (38, [8, 16]), lighter_gray)
 
     # === FRAME (lower, connecting cylinder to grip) - x: 18-30, y: 8-16 ===
-    for y in range(8, 17):
-        for x in range(18, 30):
-            if y == 16:
-                img.putpixel((x, y), COLORS['black'])
-            elif x == 18:
-                img.putpixel((x, y), COLORS['black'])
-            else:
-                # Only fill if not already part of cylinder
-                px = img.getpixel((x, y))
-                if px == COLORS['transparent']:
-                    img.putpixel((x, y), COLORS['metal_medium'])
+    draw_hline(arr, 16, 18, 30, black)
+    draw_vline(arr, 18, 8, 16, black)
+    # Only fill if not already part of cylinder
+    draw_under(arr, (19, 8, 30, 16), metal_medium)
 
     # === TRIGGER GUARD - x: 24-38, y: 16-20 ===
     # Front of guard
-    img.putpixel((38, 16), COLORS['black'])
-    img.putpixel((38, 17), COLORS['black'])
-    img.putpixel((38, 18), COLORS['black'])
-    img.putpixel((38, 19), COLORS['black'])
+    draw_vline(arr, 38, 16, 20, black)
     # Bottom of guard
-    for x in range(24, 39):
-        img.putpixel((x, 20), COLORS['black'])
+    draw_hline(arr, 20, 24, 39, black)
     # Back of guard (connects to grip)
-    img.putpixel((24, 16), COLORS['black'])
-    img.putpixel((24, 17), COLORS['black'])
-    img.putpixel((24, 18), COLORS['black'])
-    img.putpixel((24, 19), COLORS['black'])
+    draw_vline(arr, 24, 16, 20, black)
 
     # Trigger
-    for y in range(16, 19):
-        img.putpixel((30, y), COLORS['metal_dark'])
-        img.putpixel((31, y), COLORS['metal_dark'])
+    draw_rect(arr, (30, 16, 32, 19), metal_dark)
 
     # === GRIP (ergonomic rubber grip, angled back) - x: 4-18, y: 10-23 ===
-    for y in range(10, 24):
-        progress = (y - 10) / 13.0
-        offset = int(progress * 5)  # backward lean
-        gx_start = 14 - offset
-        gx_end = 20 - offset
-
-        # Grip widens slightly in the middle
-        if 3 <= (y - 10) <= 9:
-            gx_end += 1
-
-        for x in range(max(0, gx_start), min(width, gx_end + 1)):
-            if x == gx_start or x == gx_end or y == 23:
-                img.putpixel((x, y), COLORS['black'])
-            elif (x + y) % 3 == 0:
-                # Rubber grip texture (checkered pattern)
-                img.putpixel((x, y), COLORS['grip_dark'])
-            elif (x + y) % 3 == 1:
-                img.putpixel((x, y), COLORS['grip_medium'])
-            else:
-                img.putpixel((x, y), COLORS['grip_light'])
+    grip_rows = np.arange(10, 24)[:, None]
+    offset = (grip_rows - 10) * 5 // 13  # backward lean, 0..5 px over 13 rows
+    grip_starts = 14 - offset
+    # Grip widens slightly in the middle
+    grip_ends = 20 - offset + ((grip_rows - 10 >= 3) & (grip_rows - 10 <= 9))
+
+    # Mask of the angled grip within its bounding box, inclusive of both edges
+    gx0, gx1 = grip_starts.min(), grip_ends.max() + 1
+    xs = np.arange(gx0, gx1)
+    inside = (xs >= grip_starts) & (xs <= grip_ends)
+    edge = inside & ((xs == grip_starts) | (xs == grip_ends) | (grip_rows == 23))
+
+    # Rubber grip texture (checkered pattern): diagonal 3-colour stripes
+    texture = np.array([COLORS['grip_dark'], COLORS['grip_medium'], COLORS['grip_light']],
+                       dtype=np.uint8)[(xs + grip_rows) % 3]
+    grip = arr[10:24, gx0:gx1]
+    grip[inside] = texture[inside]
+    grip[edge] = black
 
     # Connect grip top to frame
-    for y in range(8, 11):
-        for x in range(14, 19):
-            px = img.getpixel((x, y))
-            if px == COLORS['transparent']:
-                img.putpixel((x, y), COLORS['metal_dark'])
+    draw_under(arr, (14, 8, 19, 11), metal_dark)
 
-    return img
+    return Image.fromarray(arr, 'RGBA')
 
 
 def create_revolver_topdown():
@@ -236,108 +164,72 @@ def create_revolver_topdown():
     with a visible cylinder bulge and thicker barrel.
     """
     width, height = 34, 14
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
+    arr = new_canvas(width, height)
+
+    black = COLORS['black']
+    dark_gray = COLORS['dark_gray']
+    lighter_gray = COLORS['lighter_gray']
+    metal_dark = COLORS['metal_dark']
+    metal_medium = COLORS['metal_medium']
+    metal_light = COLORS['metal_light']
+    grip_dark = COLORS['grip_dark']
 
     # RSh-12 top-down layout (pointing right):
     # [grip] [cylinder] [barrel]
 
     # === GRIP (rubber, rear part) - x: 0-9, y: 2-11 ===
-    for y in range(2, 12):
-        for x in range(0, 10):
-            if y == 2 or y == 11:
-                if 2 <= x <= 9:
-                    img.putpixel((x, y), COLORS['black'])
-            elif x == 0:
-                if 3 <= y <= 10:
-                    img.putpixel((x, y), COLORS['black'])
-            elif x == 9:
-                if 3 <= y <= 10:
-                    img.putpixel((x, y), COLORS['black'])
-            elif y == 3 or y == 10:
-                img.putpixel((x, y), COLORS['grip_dark'])
-            elif y in (4, 9):
-                img.putpixel((x, y), COLORS['grip_medium'])
-            else:
-                img.putpixel((x, y), COLORS['grip_light'])
+    # Light centre, shading darker towards the top and bottom edges
+    draw_rect(arr, (1, 3, 9, 11), COLORS['grip_light'])
+    draw_hline(arr, 4, 1, 9, COLORS['grip_medium'])
+    draw_hline(arr, 9, 1, 9, COLORS['grip_medium'])
+    draw_hline(arr, 3, 1, 9, grip_dark)
+    draw_hline(arr, 10, 1, 9, grip_dark)
+    # Outline with clipped corners
+    draw_hline(arr, 2, 2, 10, black)
+    draw_hline(arr, 11, 2, 10, black)
+    draw_vline(arr, 0, 3, 11, black)
+    draw_vline(arr, 9, 3, 11, black)
 
     # Grip texture (checkered rubber)
-    for y in range(4, 10):
-        for x in range(2, 8):
-            if (x + y) % 2 == 0:
-                img.putpixel((x, y), COLORS['grip_dark'])
+    ty, tx = coord_grid((2, 4, 8, 10))
+    arr[4:10, 2:8][(tx + ty) % 2 == 0] = grip_dark
 
     # === FRAME (connecting grip to cylinder) - x: 9-12, y: 3-10 ===
-    for y in range(3, 11):
-        for x in range(9, 13):
-            if y == 3 or y == 10:
-                img.putpixel((x, y), COLORS['black'])
-            else:
-                img.putpixel((x, y), COLORS['metal_medium'])
+    draw_rect(arr, (9, 4, 13, 10), metal_medium)
+    draw_hline(arr, 3, 9, 13, black)
+    draw_hline(arr, 10, 9, 13, black)
 
     # === CYLINDER (large, bulging outward - key revolver feature) - x: 12-22, y: 1-12 ===
     # The cylinder is wider than the frame, creating the distinctive revolver bulge
-    for y in range(1, 13):
-        for x in range(12, 23):
-            # Create elliptical cylinder shape
-            cy = 6.5  # center y
-            cx = 17   # center x
-            ry = 5.5  # radius y
-            rx = 5.5  # radius x
-
-            dx = (x - cx) / rx
-            dy = (y - cy) / ry
-            dist = dx * dx + dy * dy
-
-            if dist <= 1.0:
-                if dist > 0.75:
-                    img.putpixel((x, y), COLORS['black'])
-                elif dist > 0.55:
-                    img.putpixel((x, y), COLORS['metal_dark'])
-                elif y <= 4:
-                    img.putpixel((x, y), COLORS['metal_light'])
-                elif y >= 9:
-                    img.putpixel((x, y), COLORS['dark_gray'])
-                else:
-                    img.putpixel((x, y), COLORS['metal_medium'])
+    # Elliptical cylinder shape centred (17, 6.5) with radius 5.5
+    rows = np.arange(1, 13)[:, None]
+    shade = np.select([rows <= 4, rows >= 9], [metal_light, dark_gray], metal_medium)
+    draw_ellipse_bands(arr, (12, 1, 23, 13), (17, 6.5), (5.5, 5.5), shade[:, None],
+                       [(0.55, metal_dark), (0.75, black)])
 
     # Cylinder chamber details (circles visible from top)
-    # Center chamber
-    img.putpixel((17, 6), COLORS['dark_gray'])
-    img.putpixel((17, 7), COLORS['dark_gray'])
-    # Surrounding chambers (visible from top as darker spots)
-    for cx, cy in [(15, 4), (19, 4), (15, 9), (19, 9)]:
-        img.putpixel((cx, cy), COLORS['dark_gray'])
+    # Center chamber, then the surrounding chambers (darker spots from top)
+    draw_pixels(arr, ([17, 17, 15, 19, 15, 19], [6, 7, 4, 4, 9, 9]), dark_gray)
 
     # === BARREL (thick, short for 12.7mm) - x: 22-33, y: 4-9 ===
-    for y in range(4, 10):
-        for x in range(22, 33):
-            # Only draw if not already part of cylinder
-            px = img.getpixel((x, y))
-            if px == COLORS['transparent'] or x >= 23:
-                if y == 4 or y == 9:
-                    img.putpixel((x, y), COLORS['black'])
-                elif y == 5:
-                    img.putpixel((x, y), COLORS['metal_light'])
-                elif y == 8:
-                    img.putpixel((x, y), COLORS['metal_dark'])
-                else:
-                    img.putpixel((x, y), COLORS['metal_medium'])
+    # Outline top and bottom, lit top row, shaded bottom row (one shade per row)
+    barrel_shade = np.array([black, metal_light, metal_medium, metal_medium,
+                             metal_dark, black], dtype=np.uint8)[:, None]
+    draw_rect(arr, (23, 4, 33, 10), barrel_shade)
+    # The first column overlaps the cylinder: only draw where it is still empty
+    draw_under(arr, (22, 4, 23, 10), barrel_shade)
 
     # Muzzle tip
-    img.putpixel((33, 5), COLORS['black'])
-    img.putpixel((33, 6), COLORS['dark_gray'])
-    img.putpixel((33, 7), COLORS['dark_gray'])
-    img.putpixel((33, 8), COLORS['black'])
+    draw_vline(arr, 33, 5, 9, dark_gray)
+    draw_pixels(arr, (33, [5, 8]), black)
 
     # Front sight
-    img.putpixel((32, 5), COLORS['lighter_gray'])
-    img.putpixel((32, 8), COLORS['lighter_gray'])
+    draw_pixels(arr, (32, [5, 8]), lighter_gray)
 
     # Rear sight (on frame, behind cylinder)
-    img.putpixel((10, 4), COLORS['lighter_gray'])
-    img.putpixel((10, 9), COLORS['lighter_gray'])
+    draw_pixels(arr, (10, [4, 9]), lighter_gray)
 
-    return img
+    return Image.fromarray(arr, 'RGBA')
 
 
 if __name__ == '__main__':
@@ -95,9 +95,8 @@ def create_boot_print(is_left: bool) -> Image.Image:
 
         x_start = cx - width // 2
         x_end = cx + width // 2
-        for x in range(x_start, x_end + 1):
-            if 0 <= x < CANVAS_WIDTH and 0 <= y < CANVAS_HEIGHT:
-                img.putpixel((x, y), BOOT_COLOR)
+        # One C-level span fill per row; ImageDraw clips to the canvas
+        draw.line([(x_start, y), (x_end, y)], fill=BOOT_COLOR)
 
     return img
 
@@ -9,6 +9,9 @@ Style matches existing M16 rifle sprites.
 """
 
 from PIL import Image
+import sys
+
+from sprite_gen import source_key, is_up_to_date, mark_up_to_date, save_png
 
 # Color palette matching M16 style
 COLORS = {
@@ -29,6 +32,20 @@ COLORS = {
 }
 
 
+# Palette-mode drawing: every shotgun colour is opaque except 'transparent', so
+# sprites are painted with 1-byte palette indices and converted to RGBA once.
+IDX = {name: i for i, name in enumerate(COLORS)}
+PALETTE = [channel for color in COLORS.values() for channel in color[:3]]
+
+
+def new_palette_image(width, height):
+    """Return a 'P' mode canvas filled with the transparent palette entry."""
+    img = Image.new('P', (width, height), IDX['transparent'])
+    img.putpalette(PALETTE)
+    img.info['transparency'] = IDX['transparent']
+    return img
+
+
 def create_shotgun_topdown():
     """
     Create 64x16 top-down view shotgun sprite.
@@ -38,67 +55,52 @@ def create_shotgun_topdown():
     - Stock at the back
     """
     width, height = 64, 16
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
+    img = new_palette_image(width, height)
 
     # Pump-action shotgun top-down layout (pointing right):
     # [stock] [receiver] [pump/forend] [barrel]
 
+    # Solid rows and rectangles are filled with Image.paste(color, box); each
+    # region is painted base colour first, then its shading and outline rows.
+
     # Stock (wooden, rear part) - x: 0-12
-    for y in range(5, 11):
-        for x in range(0, 13):
-            if y == 5 or y == 10:
-                if x >= 3:
-                    img.putpixel((x, y), COLORS['black'])
-            elif y in [6, 9]:
-                if x >= 1:
-                    img.putpixel((x, y), COLORS['black'] if x <= 1 else COLORS['wood_dark'])
-            else:  # y in [7, 8]
-                if x >= 0:
-                    img.putpixel((x, y), COLORS['wood_medium'] if x > 0 else COLORS['black'])
+    img.paste(IDX['black'], (3, 5, 13, 6))
+    img.paste(IDX['black'], (3, 10, 13, 11))
+    for y in (6, 9):
+        img.paste(IDX['wood_dark'], (2, y, 13, y + 1))
+        img.paste(IDX['black'], (1, y, 2, y + 1))
+    img.paste(IDX['wood_medium'], (1, 7, 13, 9))
+    img.paste(IDX['black'], (0, 7, 1, 9))
 
     # Receiver (metal body) - x: 13-30
-    for y in range(4, 12):
-        for x in range(13, 31):
-            if y == 4 or y == 11:
-                img.putpixel((x, y), COLORS['black'])
-            elif y in [5, 10]:
-                img.putpixel((x, y), COLORS['dark_gray'])
-            else:
-                img.putpixel((x, y), COLORS['medium_gray'])
+    img.paste(IDX['medium_gray'], (13, 4, 31, 12))
+    img.paste(IDX['dark_gray'], (13, 5, 31, 6))
+    img.paste(IDX['dark_gray'], (13, 10, 31, 11))
+    img.paste(IDX['black'], (13, 4, 31, 5))
+    img.paste(IDX['black'], (13, 11, 31, 12))
 
     # Trigger guard area - small detail at bottom
-    for y in range(12, 15):
-        for x in range(18, 25):
-            if y == 12:
-                img.putpixel((x, y), COLORS['black'])
-            elif x == 18 or x == 24:
-                img.putpixel((x, y), COLORS['black'])
-            elif y == 14:
-                img.putpixel((x, y), COLORS['black'])
+    img.paste(IDX['black'], (18, 12, 25, 13))
+    img.paste(IDX['black'], (18, 14, 25, 15))
+    img.paste(IDX['black'], (18, 13, 19, 14))
+    img.paste(IDX['black'], (24, 13, 25, 14))
 
     # Pump/Forend (wooden, sliding part) - x: 31-45
-    for y in range(5, 11):
-        for x in range(31, 46):
-            if y == 5 or y == 10:
-                img.putpixel((x, y), COLORS['black'])
-            elif y in [6, 9]:
-                img.putpixel((x, y), COLORS['wood_dark'])
-            else:  # middle part
-                img.putpixel((x, y), COLORS['wood_medium'])
+    img.paste(IDX['wood_medium'], (31, 5, 46, 11))
+    img.paste(IDX['wood_dark'], (31, 6, 46, 7))
+    img.paste(IDX['wood_dark'], (31, 9, 46, 10))
+    img.paste(IDX['black'], (31, 5, 46, 6))
+    img.paste(IDX['black'], (31, 10, 46, 11))
 
     # Barrel (metal tube) - x: 46-63
-    for y in range(6, 10):
-        for x in range(46, 64):
-            if y == 6 or y == 9:
-                img.putpixel((x, y), COLORS['black'])
-            else:
-                img.putpixel((x, y), COLORS['light_gray'])
+    img.paste(IDX['light_gray'], (46, 6, 64, 10))
+    img.paste(IDX['black'], (46, 6, 64, 7))
+    img.paste(IDX['black'], (46, 9, 64, 10))
 
     # Muzzle end detail
-    for y in range(5, 11):
-        img.putpixel((63, y), COLORS['black'])
+    img.paste(IDX['black'], (63, 5, 64, 11))
 
-    return img
+    return img.convert('RGBA')
 
 
 def create_shotgun_icon():
@@ -110,112 +112,102 @@ def create_shotgun_icon():
     - Thicker barrel
     """
     width, height = 80, 24
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
+    img = new_palette_image(width, height)
 
     # Shotgun side view (pointing right):
     # [stock] [grip] [receiver] [pump/forend] [barrel]
 
     # Stock (wooden, curved) - x: 0-18
     for y in range(6, 17):
-        for x in range(0, 19):
-            # Create angled stock shape
-            if y <= 8:
-                min_x = 14 - (y - 6) * 3
-            elif y <= 11:
-                min_x = 0
-            else:
-                min_x = (y - 11) * 2
-
-            if x >= min_x:
-                if y == 6 or y == 16 or x == min_x or x == 18:
-                    img.putpixel((x, y), COLORS['metal_dark'])
-                else:
-                    img.putpixel((x, y), COLORS['wood_medium'])
+        # Create angled stock shape
+        if y <= 8:
+            min_x = 14 - (y - 6) * 3
+        elif y <= 11:
+            min_x = 0
+        else:
+            min_x = (y - 11) * 2
+
+        if y == 6 or y == 16:
+            img.paste(IDX['metal_dark'], (min_x, y, 19, y + 1))
+        else:
+            img.paste(IDX['wood_medium'], (min_x + 1, y, 18, y + 1))
+            img.paste(IDX['metal_dark'], (min_x, y, min_x + 1, y + 1))
+            img.paste(IDX['metal_dark'], (18, y, 19, y + 1))
 
     # Receiver (metal body) - x: 19-38
-    for y in range(5, 15):
-        for x in range(19, 39):
-            if y == 5 or y == 14:
-                img.putpixel((x, y), COLORS['metal_dark'])
-            elif y == 6 or y == 13:
-                img.putpixel((x, y), COLORS['metal_medium'])
-            else:
-                img.putpixel((x, y), COLORS['metal_light'])
-
-    # Pistol grip - below receiver
-    for y in range(14, 22):
-        for x in range(22, 30):
-            if y == 14:
-                continue  # skip top (part of receiver)
-            grip_width = 8 - (y - 14) // 2
-            start_x = 22 + (8 - grip_width) // 2
-            if start_x <= x < start_x + grip_width:
-                if y == 21 or x == start_x or x == start_x + grip_width - 1:
-                    img.putpixel((x, y), COLORS['metal_dark'])
-                else:
-                    img.putpixel((x, y), COLORS['wood_dark'])
+    img.paste(IDX['metal_light'], (19, 5, 39, 15))
+    img.paste(IDX['metal_medium'], (19, 6, 39, 7))
+    img.paste(IDX['metal_medium'], (19, 13, 39, 14))
+    img.paste(IDX['metal_dark'], (19, 5, 39, 6))
+    img.paste(IDX['metal_dark'], (19, 14, 39, 15))
+
+    # Pistol grip - below receiver (top row 14 is part of the receiver)
+    for y in range(15, 22):
+        grip_width = 8 - (y - 14) // 2
+        start_x = 22 + (8 - grip_width) // 2
+        end_x = start_x + grip_width
+        if y == 21:
+            img.paste(IDX['metal_dark'], (start_x, y, end_x, y + 1))
+        else:
+            img.paste(IDX['wood_dark'], (start_x + 1, y, end_x - 1, y + 1))
+            img.paste(IDX['metal_dark'], (start_x, y, start_x + 1, y + 1))
+            img.paste(IDX['metal_dark'], (end_x - 1, y, end_x, y + 1))
 
     # Trigger guard
-    for y in range(14, 19):
-        for x in range(30, 38):
-            if y == 14 or y == 18:
-                img.putpixel((x, y), COLORS['metal_dark'])
-            elif x == 30 or x == 37:
-                img.putpixel((x, y), COLORS['metal_dark'])
+    img.paste(IDX['metal_dark'], (30, 14, 38, 15))
+    img.paste(IDX['metal_dark'], (30, 18, 38, 19))
+    img.paste(IDX['metal_dark'], (30, 15, 31, 18))
+    img.paste(IDX['metal_dark'], (37, 15, 38, 18))
 
     # Pump/Forend (wooden) - x: 39-55
-    for y in range(7, 13):
-        for x in range(39, 56):
-            if y == 7 or y == 12:
-                img.putpixel((x, y), COLORS['metal_dark'])
-            elif y == 8 or y == 11:
-                img.putpixel((x, y), COLORS['wood_dark'])
-            else:
-                img.putpixel((x, y), COLORS['wood_medium'])
+    img.paste(IDX['wood_medium'], (39, 7, 56, 13))
+    img.paste(IDX['wood_dark'], (39, 8, 56, 9))
+    img.paste(IDX['wood_dark'], (39, 11, 56, 12))
+    img.paste(IDX['metal_dark'], (39, 7, 56, 8))
+    img.paste(IDX['metal_dark'], (39, 12, 56, 13))
 
     # Barrel (metal, thicker for shotgun) - x: 56-79
-    for y in range(8, 12):
-        for x in range(56, 80):
-            if y == 8 or y == 11:
-                img.putpixel((x, y), COLORS['metal_dark'])
-            else:
-                img.putpixel((x, y), COLORS['metal_medium'])
+    img.paste(IDX['metal_medium'], (56, 8, 80, 12))
+    img.paste(IDX['metal_dark'], (56, 8, 80, 9))
+    img.paste(IDX['metal_dark'], (56, 11, 80, 12))
 
     # Magazine tube (below barrel)
-    for y in range(12, 14):
-        for x in range(39, 75):
-            if y == 12:
-                img.putpixel((x, y), COLORS['metal_dark'])
-            else:
-                img.putpixel((x, y), COLORS['metal_medium'])
+    img.paste(IDX['metal_dark'], (39, 12, 75, 13))
+    img.paste(IDX['metal_medium'], (39, 13, 75, 14))
 
     # Muzzle end
-    for y in range(7, 13):
-        img.putpixel((79, y), COLORS['metal_dark'])
+    img.paste(IDX['metal_dark'], (79, 7, 80, 13))
 
     # Front sight
-    for y in range(5, 8):
-        img.putpixel((75, y), COLORS['metal_dark'])
-        img.putpixel((76, y), COLORS['metal_dark'])
+    img.paste(IDX['metal_dark'], (75, 5, 77, 8))
 
-    return img
+    return img.convert('RGBA')
 
 
 if __name__ == '__main__':
+    outputs = [
+        'experiments/shotgun_topdown.png',
+        'experiments/shotgun_icon.png',
+        'assets/sprites/weapons/shotgun_topdown.png',
+        'assets/sprites/weapons/shotgun_icon.png',
+    ]
+    key = source_key(__file__)
+    if is_up_to_date(outputs, key):
+        print("Shotgun sprites are up to date, nothing to do")
+        sys.exit(0)
+
     # Create sprites
     topdown = create_shotgun_topdown()
     icon = create_shotgun_icon()
 
-    # Save to experiments folder first
-    topdown.save('experiments/shotgun_topdown.png')
-    icon.save('experiments/shotgun_icon.png')
+    # Save to experiments folder first, then copy the files to assets
+    save_png(topdown, [outputs[0], outputs[2]])
+    save_png(icon, [outputs[1], outputs[3]])
 
     print(f"Created shotgun_topdown.png: {topdown.size}")
     print(f"Created shotgun_icon.png: {icon.size}")
 
-    # Also save to assets folder
-    topdown.save('assets/sprites/weapons/shotgun_topdown.png')
-    icon.save('assets/sprites/weapons/shotgun_icon.png')
+    mark_up_to_date(outputs, key)
 
     print("\nSprites saved to:")
     print("  - experiments/shotgun_topdown.png")
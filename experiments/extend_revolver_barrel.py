@@ -6,134 +6,99 @@ Issue #646: Make the revolver barrel 2 times longer.
 This script modifies the existing revolver sprites to extend the barrel length.
 """
 
+import sys
+
 from PIL import Image
+import numpy as np
+
+from sprite_gen import save_png
+from sprite_gen import draw_rect, draw_hline, draw_vline
+from sprite_gen import WEAPON_COLORS as COLORS
+
+# Widths of the sprites before the extension, and the columns each one gains
+ICON_WIDTH = 80
+ICON_BARREL_EXTENSION = 25  # Add 25 pixels to double the barrel length
+TOPDOWN_WIDTH = 34
+TOPDOWN_BARREL_EXTENSION = 11  # Add 11 pixels to double the barrel length
+
+
+def load_rgba(path):
+    """Decode a sprite PNG once into a (height, width, 4) RGBA array."""
+    with Image.open(path) as img:
+        return np.asarray(img.convert('RGBA'))
 
-# Color palette from create_revolver_sprites.py
-COLORS = {
-    'black': (30, 30, 30, 255),
-    'dark_gray': (45, 45, 45, 255),
-    'medium_gray': (60, 60, 60, 255),
-    'light_gray': (70, 70, 70, 255),
-    'lighter_gray': (90, 90, 90, 255),
-    'highlight': (100, 100, 100, 255),
-    'metal_dark': (35, 35, 40, 255),
-    'metal_medium': (50, 50, 55, 255),
-    'metal_light': (70, 70, 75, 255),
-    'grip_dark': (50, 40, 30, 255),
-    'grip_medium': (70, 55, 40, 255),
-    'grip_light': (85, 70, 50, 255),
-    'transparent': (0, 0, 0, 0),
-}
-
-
-def extend_icon_barrel(original_img):
+
+def splice_gap(src, cut, width):
+    """
+    Return a copy of the RGBA array src with `width` transparent columns
+    inserted at x = cut; everything from cut onwards shifts right.
+    """
+    height, orig_width = src.shape[:2]
+
+    # Every column outside the gap is copied from the original, so only the
+    # gap needs clearing to transparent. Each side is one block copy
+    dst = np.empty((height, orig_width + width, 4), dtype=np.uint8)
+    dst[:, cut:cut + width] = 0
+    dst[:, :cut] = src[:, :cut]
+    dst[:, cut + width:] = src[:, cut:]
+    return dst
+
+
+def extend_icon_barrel(src):
     """
     Extend the icon barrel from ~25 pixels to ~50 pixels (2x).
     Original barrel: x 50-75
     New barrel: x 50-100
 
-    The image will grow from 80x24 to ~105x24
+    The image will grow from 80x24 to ~105x24. Takes and returns an RGBA
+    array (see load_rgba).
     """
-    orig_width, height = original_img.size
-    barrel_extension = 25  # Add 25 pixels to double the barrel length
-    new_width = orig_width + barrel_extension
-
-    # Create new image with extended width
-    new_img = Image.new('RGBA', (new_width, height), COLORS['transparent'])
-
-    # Copy all pixels from original, but shift the barrel part to the right
-    for y in range(height):
-        for x in range(orig_width):
-            pixel = original_img.getpixel((x, y))
-            if x < 50:
-                # Copy grip, frame, and cylinder as-is
-                new_img.putpixel((x, y), pixel)
-            elif x >= 50:
-                # Shift barrel to the right by barrel_extension
-                new_img.putpixel((x + barrel_extension, y), pixel)
+    # Copy grip, frame, and cylinder as-is; shift the barrel part to the right
+    dst = splice_gap(src, 50, ICON_BARREL_EXTENSION)
 
     # Fill the gap with extended barrel (x: 50-75)
-    # This extends the barrel body
-    for x in range(50, 75):
-        for y in range(5, 12):
-            # Top edge
-            if y == 5:
-                new_img.putpixel((x, y), COLORS['black'])
-            # Bottom edge
-            elif y == 11:
-                new_img.putpixel((x, y), COLORS['black'])
-            # Barrel body shading
-            elif y == 6:
-                new_img.putpixel((x, y), COLORS['metal_light'])
-            elif y == 10:
-                new_img.putpixel((x, y), COLORS['metal_dark'])
-            elif y == 7:
-                new_img.putpixel((x, y), COLORS['lighter_gray'])
-            else:
-                new_img.putpixel((x, y), COLORS['metal_medium'])
+    # This extends the barrel body: top/bottom edges, then body shading
+    draw_rect(dst, (50, 8, 75, 10), COLORS['metal_medium'])
+    draw_hline(dst, 5, 50, 75, COLORS['black'])
+    draw_hline(dst, 11, 50, 75, COLORS['black'])
+    draw_hline(dst, 6, 50, 75, COLORS['metal_light'])
+    draw_hline(dst, 7, 50, 75, COLORS['lighter_gray'])
+    draw_hline(dst, 10, 50, 75, COLORS['metal_dark'])
 
     # Extend the under-barrel lug
-    for y in range(11, 14):
-        for x in range(50, 68):
-            if y == 13:
-                new_img.putpixel((x, y), COLORS['black'])
-            elif x == 50:
-                new_img.putpixel((x, y), COLORS['black'])
-            else:
-                new_img.putpixel((x, y), COLORS['metal_dark'])
+    draw_rect(dst, (50, 11, 68, 13), COLORS['metal_dark'])
+    draw_vline(dst, 50, 11, 13, COLORS['black'])
+    draw_hline(dst, 13, 50, 68, COLORS['black'])
 
-    # Add ventilated rib slots on the extended barrel
-    for x in range(54, 73, 4):
-        new_img.putpixel((x, 6), COLORS['dark_gray'])
-        new_img.putpixel((x + 1, 6), COLORS['dark_gray'])
+    # Add ventilated rib slots on the extended barrel: 2px slots every 4px
+    # from x = 54, one strided store per slot column
+    draw_rect(dst, (54, 6, 73, 7), COLORS['dark_gray'], step=(4, 1))
+    draw_rect(dst, (55, 6, 74, 7), COLORS['dark_gray'], step=(4, 1))
 
-    return new_img
+    return dst
 
 
-def extend_topdown_barrel(original_img):
+def extend_topdown_barrel(src):
     """
     Extend the topdown barrel from ~11 pixels to ~22 pixels (2x).
     Original barrel: x 22-33
     New barrel: x 22-44
 
-    The image will grow from 34x14 to ~45x14
+    The image will grow from 34x14 to ~45x14. Takes and returns an RGBA
+    array (see load_rgba).
     """
-    orig_width, height = original_img.size
-    barrel_extension = 11  # Add 11 pixels to double the barrel length
-    new_width = orig_width + barrel_extension
-
-    # Create new image with extended width
-    new_img = Image.new('RGBA', (new_width, height), COLORS['transparent'])
-
-    # Copy all pixels from original, but shift the barrel part to the right
-    for y in range(height):
-        for x in range(orig_width):
-            pixel = original_img.getpixel((x, y))
-            if x < 22:
-                # Copy grip, frame, and cylinder as-is
-                new_img.putpixel((x, y), pixel)
-            elif x >= 22:
-                # Shift barrel to the right by barrel_extension
-                new_img.putpixel((x + barrel_extension, y), pixel)
+    # Copy grip, frame, and cylinder as-is; shift the barrel part to the right
+    dst = splice_gap(src, 22, TOPDOWN_BARREL_EXTENSION)
 
     # Fill the gap with extended barrel (x: 22-33)
-    for x in range(22, 33):
-        for y in range(4, 10):
-            # Top edge
-            if y == 4:
-                new_img.putpixel((x, y), COLORS['black'])
-            # Bottom edge
-            elif y == 9:
-                new_img.putpixel((x, y), COLORS['black'])
-            # Barrel body shading
-            elif y == 5:
-                new_img.putpixel((x, y), COLORS['metal_light'])
-            elif y == 8:
-                new_img.putpixel((x, y), COLORS['metal_dark'])
-            else:
-                new_img.putpixel((x, y), COLORS['metal_medium'])
-
-    return new_img
+    # Top/bottom edges, then body shading
+    draw_rect(dst, (22, 6, 33, 8), COLORS['metal_medium'])
+    draw_hline(dst, 4, 22, 33, COLORS['black'])
+    draw_hline(dst, 9, 22, 33, COLORS['black'])
+    draw_hline(dst, 5, 22, 33, COLORS['metal_light'])
+    draw_hline(dst, 8, 22, 33, COLORS['metal_dark'])
+
+    return dst
 
 
 if __name__ == '__main__':
@@ -141,34 +106,43 @@ if __name__ == '__main__':
     icon_path = 'assets/sprites/weapons/revolver_icon.png'
     topdown_path = 'assets/sprites/weapons/revolver_topdown.png'
 
-    print("Loading original sprites...")
-    icon = Image.open(icon_path)
-    topdown = Image.open(topdown_path)
+    # (label, asset path, review copy, extend function, original width, added columns)
+    sprites = [
+        ('icon', icon_path, 'experiments/revolver_icon_extended.png',
+         extend_icon_barrel, ICON_WIDTH, ICON_BARREL_EXTENSION),
+        ('topdown', topdown_path, 'experiments/revolver_topdown_extended.png',
+         extend_topdown_barrel, TOPDOWN_WIDTH, TOPDOWN_BARREL_EXTENSION),
+    ]
 
-    print(f"Original icon size: {icon.size}")
-    print(f"Original topdown size: {topdown.size}")
+    print("Loading original sprites...")
+    pending = []
+    for label, path, review_path, extend, width, extension in sprites:
+        src = load_rgba(path)
+        print(f"Original {label} size: {src.shape[1::-1]}")
+        # The extended sprites replace their own inputs, so the input width
+        # tells whether this sprite was already extended: only an original-
+        # width sprite is extended, which makes reruns safe
+        if src.shape[1] == width + extension:
+            print(f"  {label} barrel is already extended, skipping")
+        elif src.shape[1] != width:
+            sys.exit(f"Unexpected {label} width {src.shape[1]}, expected {width}")
+        else:
+            pending.append((label, path, review_path, extend, src))
+
+    if not pending:
+        print("Revolver barrels are already extended, nothing to do")
+        sys.exit(0)
 
     # Extend barrels
     print("\nExtending barrels by 2x...")
-    new_icon = extend_icon_barrel(icon)
-    new_topdown = extend_topdown_barrel(topdown)
-
-    print(f"New icon size: {new_icon.size}")
-    print(f"New topdown size: {new_topdown.size}")
-
-    # Save to experiments folder for review
-    new_icon.save('experiments/revolver_icon_extended.png')
-    new_topdown.save('experiments/revolver_topdown_extended.png')
-
-    print("\nExtended sprites saved to experiments folder:")
-    print("  - experiments/revolver_icon_extended.png")
-    print("  - experiments/revolver_topdown_extended.png")
+    for label, path, review_path, extend, src in pending:
+        extended = Image.fromarray(extend(src), 'RGBA')
+        print(f"New {label} size: {extended.size}")
 
-    # Save to assets folder (replacing originals)
-    new_icon.save(icon_path)
-    new_topdown.save(topdown_path)
+        # Save to experiments folder for review; the asset gets a copy of
+        # that file instead of a second encode (replacing the original)
+        save_png(extended, [review_path, path])
+        print(f"  - {review_path}")
+        print(f"  - {path}")
 
-    print("\nOriginal sprites updated:")
-    print(f"  - {icon_path}")
-    print(f"  - {topdown_path}")
     print("\nBarrel length extended by 2x successfully!")
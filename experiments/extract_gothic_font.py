@@ -10,6 +10,7 @@ Produces a BMFont-compatible sprite sheet and .fnt file for Godot 4.x.
 
 from PIL import Image, ImageDraw
 import numpy as np
+import functools
 import os
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -54,17 +55,28 @@ ROWS = [
 ]
 
 
-def auto_trim_alpha(img_rgba, min_alpha=20):
-    """Trim transparent borders from an RGBA image."""
-    arr = np.array(img_rgba)
-    alpha = arr[:, :, 3]
-    rows = np.any(alpha >= min_alpha, axis=1)
-    cols = np.any(alpha >= min_alpha, axis=0)
-    if not rows.any() or not cols.any():
-        return img_rgba
-    y1, y2 = np.where(rows)[0][[0, -1]]
-    x1, x2 = np.where(cols)[0][[0, -1]]
-    return img_rgba.crop((x1, y1, x2 + 1, y2 + 1))
+def auto_trim_alpha(alpha, min_alpha=20):
+    """Return the (y1, y2, x1, x2) box, end-exclusive, that trims the
+    transparent borders from an alpha plane; the full plane if it is empty."""
+    # One threshold pass over the alpha plane, reduced along each axis
+    mask = alpha >= min_alpha
+    rows = mask.any(axis=1)
+    if not rows.any():
+        return 0, alpha.shape[0], 0, alpha.shape[1]
+    cols = mask.any(axis=0)
+    # First and last set entries, without materialising np.where indices
+    y1 = int(np.argmax(rows))
+    y2 = len(rows) - int(np.argmax(rows[::-1]))
+    x1 = int(np.argmax(cols))
+    x2 = len(cols) - int(np.argmax(cols[::-1]))
+    return y1, y2, x1, x2
+
+
+@functools.lru_cache(maxsize=4)
+def load_source(path, mtime):
+    """Decode the source image as RGBA; cached per (path, mtime) so repeated
+    calls in one process skip the PNG decode until the file changes."""
+    return Image.open(path).convert('RGBA')
 
 
 def main():
@@ -73,10 +85,16 @@ def main():
         print(f"ERROR: Image not found at {INPUT_IMAGE}")
         return
 
-    img = Image.open(INPUT_IMAGE).convert('RGBA')
+    img = load_source(INPUT_IMAGE, os.path.getmtime(INPUT_IMAGE))
     width, height = img.size
     print(f"Image size: {width}x{height}")
 
+    # Only the alpha channel is used, so pull it out once into a dense plane
+    # (instead of reading every 4th byte of the RGBA buffer per glyph). Glyphs
+    # are sliced out of it as views; nothing is copied until the trimmed
+    # glyph is built
+    alpha_plane = np.ascontiguousarray(np.asarray(img)[:, :, 3])
+
     all_chars = []
 
     for char_list, y1, y2, x_splits in ROWS:
@@ -86,21 +104,17 @@ def main():
         for i, char in enumerate(char_list):
             cx1, cx2 = x_splits[i], x_splits[i + 1]
 
-            # Crop from RGBA source
-            crop = img.crop((cx1, y1, cx2, y2))
+            # Alpha of the cell, auto-trimmed of transparent borders
+            alpha = alpha_plane[y1:y2, cx1:cx2]
+            ty1, ty2, tx1, tx2 = auto_trim_alpha(alpha, min_alpha=20)
+            alpha = alpha[ty1:ty2, tx1:tx2]
 
-            # Convert to white-on-alpha
-            crop_arr = np.array(crop)
-            result = np.zeros_like(crop_arr)
-            result[:, :, 0] = 255
-            result[:, :, 1] = 255
-            result[:, :, 2] = 255
-            result[:, :, 3] = crop_arr[:, :, 3]
+            # Convert to white-on-alpha: one store for RGB, one for alpha
+            result = np.empty(alpha.shape + (4,), dtype=np.uint8)
+            result[:, :, :3] = 255
+            result[:, :, 3] = alpha
             glyph = Image.fromarray(result)
 
-            # Auto-trim transparent borders
-            glyph = auto_trim_alpha(glyph, min_alpha=20)
-
             all_chars.append({
                 'char': char,
                 'glyph': glyph,
@@ -146,6 +160,8 @@ def main():
 
     sheet = Image.new('RGBA', (sheet_w, sheet_h), (0, 0, 0, 0))
     fnt_chars = []
+    # Sheet boxes that received a glyph; everything else stays transparent
+    placed = []
 
     for idx, c in enumerate(all_chars):
         row = idx // cols_per_row
@@ -156,6 +172,7 @@ def main():
         dest_y = row * cell_h + cell_padding + y_offset
 
         sheet.paste(c['glyph'], (dest_x, dest_y), c['glyph'])
+        placed.append((dest_x, dest_y, dest_x + c['width'], dest_y + c['height']))
 
         fnt_chars.append({
             'id': ord(c['char']),
@@ -187,6 +204,7 @@ def main():
     plus_y_offset = (cell_h - cell_padding * 2) - plus_size
     plus_dest_y = plus_row * cell_h + cell_padding + plus_y_offset
     sheet.paste(plus_img, (plus_dest_x, plus_dest_y), plus_img)
+    placed.append((plus_dest_x, plus_dest_y, plus_dest_x + plus_size, plus_dest_y + plus_size))
 
     fnt_chars.append({
         'id': ord('+'),
@@ -220,7 +238,7 @@ def main():
     x_char = next(c for c in all_chars if c['char'] == 'X')
     x_scaled = x_char['glyph'].resize(
         (int(x_char['width'] * 0.7), int(x_char['height'] * 0.7)),
-        Image.LANCZOS
+        Image.Resampling.LANCZOS
     )
     x_idx = plus_idx + 2
     x_row = x_idx // cols_per_row
@@ -229,6 +247,7 @@ def main():
     x_y_offset = (cell_h - cell_padding * 2) - x_scaled.height
     x_dest_y = x_row * cell_h + cell_padding + x_y_offset
     sheet.paste(x_scaled, (x_dest_x, x_dest_y), x_scaled)
+    placed.append((x_dest_x, x_dest_y, x_dest_x + x_scaled.width, x_dest_y + x_scaled.height))
 
     fnt_chars.append({
         'id': ord('x'),
@@ -249,20 +268,29 @@ def main():
     sheet.save(sheet_path)
     print(f"\nSprite sheet saved: {sheet_path}")
 
+    # Composite the sheet onto the dark background only where glyphs were
+    # placed; a fully transparent mask leaves the rest of the canvas as is
     debug_sheet = Image.new('RGBA', (sheet_w, sheet_h), (30, 30, 30, 255))
-    debug_sheet.paste(sheet, (0, 0), sheet)
+    for box in placed:
+        region = sheet.crop(box)
+        debug_sheet.paste(region, box[:2], region)
     debug_sheet_path = os.path.join(EXPERIMENT_DIR, "gothic_sheet_debug_v5.png")
     debug_sheet.save(debug_sheet_path)
     print(f"Debug sheet saved: {debug_sheet_path}")
 
     fnt_path = os.path.join(OUTPUT_DIR, "gothic_bitmap.fnt")
+    lines = [
+        f'info face="GothicBitmap" size={cell_h} bold=0 italic=0 charset="" unicode=1 stretchH=100 smooth=0 aa=1 padding=0,0,0,0 spacing=0,0 outline=0',
+        f'common lineHeight={cell_h} base={cell_h - cell_padding} scaleW={sheet_w} scaleH={sheet_h} pages=1 packed=0 alphaChnl=0 redChnl=0 greenChnl=0 blueChnl=0',
+        'page id=0 file="gothic_bitmap.png"',
+        f'chars count={len(fnt_chars)}',
+    ]
+    lines += [
+        f'char id={fc["id"]:<6d}x={fc["x"]:<6d}y={fc["y"]:<6d}width={fc["width"]:<6d}height={fc["height"]:<6d}xoffset={fc["xoffset"]:<6d}yoffset={fc["yoffset"]:<6d}xadvance={fc["xadvance"]:<6d}page={fc["page"]:<4d}chnl={fc["chnl"]}'
+        for fc in fnt_chars
+    ]
     with open(fnt_path, 'w') as f:
-        f.write(f'info face="GothicBitmap" size={cell_h} bold=0 italic=0 charset="" unicode=1 stretchH=100 smooth=0 aa=1 padding=0,0,0,0 spacing=0,0 outline=0\n')
-        f.write(f'common lineHeight={cell_h} base={cell_h - cell_padding} scaleW={sheet_w} scaleH={sheet_h} pages=1 packed=0 alphaChnl=0 redChnl=0 greenChnl=0 blueChnl=0\n')
-        f.write(f'page id=0 file="gothic_bitmap.png"\n')
-        f.write(f'chars count={len(fnt_chars)}\n')
-        for fc in fnt_chars:
-            f.write(f'char id={fc["id"]:<6d}x={fc["x"]:<6d}y={fc["y"]:<6d}width={fc["width"]:<6d}height={fc["height"]:<6d}xoffset={fc["xoffset"]:<6d}yoffset={fc["yoffset"]:<6d}xadvance={fc["xadvance"]:<6d}page={fc["page"]:<4d}chnl={fc["chnl"]}\n')
+        f.write('\n'.join(lines) + '\n')
 
     print(f"BMFont file saved: {fnt_path}")
     print(f"\nTotal glyphs: {len(fnt_chars)}")
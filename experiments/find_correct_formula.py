@@ -10,8 +10,11 @@ The two-phase model:
 We need to find v0 such that the grenade travels exactly distance d.
 """
 
+import functools
 import math
 
+import numpy as np
+
 DELTA = 1.0 / 60.0
 
 def simulate(initial_speed, ground_friction=300.0, min_mult=0.5, ramp_vel=200.0):
@@ -30,21 +33,35 @@ def simulate(initial_speed, ground_friction=300.0, min_mult=0.5, ramp_vel=200.0)
     velocity = initial_speed
     position = 0.0
 
+    # Loop invariants, computed once per call rather than once per frame
+    f = ground_friction * min_mult * DELTA  # constant Phase 1 friction step
+    mult_span = 1.0 - min_mult
+
+    # Phase 1 (velocity >= ramp_vel) has a constant friction step, so its
+    # frames are an arithmetic progression: n frames of -f each, summed in
+    # closed form instead of stepped one by one. The per-frame
+    # clamp at zero velocity cannot trigger while f <= ramp_vel.
+    if velocity >= ramp_vel and 0.0 < f <= ramp_vel:
+        n = math.floor((velocity - ramp_vel) / f) + 1
+        position = (n * velocity - f * n * (n + 1) / 2.0) * DELTA
+        velocity -= n * f
+
+    # Otherwise step Phase 1 frame by frame with the same constant step
+    while velocity >= ramp_vel and velocity > 0.001:
+        velocity = max(velocity - f, 0.0)
+        position += velocity * DELTA
+
+    # Phase 2 (below ramp_vel): friction ramps up with falling speed
     while velocity > 0.001:
         # Calculate friction (this runs in _physics_process)
-        if velocity >= ramp_vel:
-            friction_multiplier = min_mult
-        else:
-            t = velocity / ramp_vel
-            friction_multiplier = min_mult + (1.0 - min_mult) * (1.0 - t * t)
+        t = velocity / ramp_vel
+        friction_multiplier = min_mult + mult_span * (1.0 - t * t)
 
         effective_friction = ground_friction * friction_multiplier
         friction_force = effective_friction * DELTA
 
-        if friction_force > velocity:
-            velocity = 0.0
-        else:
-            velocity -= friction_force
+        # Friction stops the grenade rather than reversing it
+        velocity = max(velocity - friction_force, 0.0)
 
         # Position updated with new velocity (symplectic Euler)
         position += velocity * DELTA
@@ -52,6 +69,38 @@ def simulate(initial_speed, ground_friction=300.0, min_mult=0.5, ramp_vel=200.0)
     return position
 
 
+def simulate_many(initial_speeds, ground_friction=300.0, min_mult=0.5, ramp_vel=200.0):
+    """simulate() for an array of initial speeds, stepping all of them together.
+
+    Each element goes through exactly the same arithmetic as a scalar
+    simulate() call; a grenade that has stopped is simply left out of the
+    remaining frames.
+    """
+    velocity = np.array(initial_speeds, dtype=float)
+    position = np.zeros_like(velocity)
+
+    # Phase 1 in closed form, as in simulate()
+    f = ground_friction * min_mult * DELTA
+    mult_span = 1.0 - min_mult
+    if 0.0 < f <= ramp_vel:
+        fast = velocity >= ramp_vel
+        n = np.floor((velocity[fast] - ramp_vel) / f) + 1
+        position[fast] = (n * velocity[fast] - f * n * (n + 1) / 2.0) * DELTA
+        velocity[fast] -= n * f
+
+    moving = velocity > 0.001
+    while moving.any():
+        v = velocity[moving]
+        t = v / ramp_vel
+        friction_multiplier = np.where(v >= ramp_vel, min_mult, min_mult + mult_span * (1.0 - t * t))
+        v = np.maximum(v - ground_friction * friction_multiplier * DELTA, 0.0)
+        velocity[moving] = v
+        position[moving] += v * DELTA
+        moving = velocity > 0.001
+
+    return position
+
+
 def find_speed_for_distance(target_distance, ground_friction=300.0, min_mult=0.5, ramp_vel=200.0):
     """Binary search for the exact speed to reach target distance."""
     lo, hi = 1.0, 5000.0
@@ -72,12 +121,25 @@ def find_speed_for_distance(target_distance, ground_friction=300.0, min_mult=0.5
 #   d2 is a fixed value that depends only on the parameters, not on v0
 # Total: d = d1 + d2
 
+@functools.lru_cache(maxsize=None)
 def calculate_d2(ground_friction=300.0, min_mult=0.5, ramp_vel=200.0):
     """Calculate the distance traveled in Phase 2 (below ramp_vel)."""
-    # Simulate just Phase 2
+    # Simulate just Phase 2; memoised, so once per parameter set
     return simulate(ramp_vel, ground_friction, min_mult, ramp_vel)
 
 
+@functools.lru_cache(maxsize=None)
+def short_throw_table(ground_friction=300.0, min_mult=0.5, ramp_vel=200.0, samples=1024):
+    """(distances, speeds) for v0 in [0, ramp_vel], sampled once per parameter set.
+
+    Distance grows monotonically with v0, so np.interp over this table
+    inverts simulate() for throws that never leave Phase 2.
+    """
+    speeds = np.linspace(0.0, ramp_vel, samples)
+    distances = simulate_many(speeds, ground_friction, min_mult, ramp_vel)
+    return distances, speeds
+
+
 def analytical_speed(target_distance, ground_friction=300.0, min_mult=0.5, ramp_vel=200.0):
     """Calculate speed analytically using the two-phase model.
 
@@ -88,21 +150,26 @@ def analytical_speed(target_distance, ground_friction=300.0, min_mult=0.5, ramp_
     Solving for v0:
     v0 = sqrt(ramp_vel^2 + 2 * ground_friction * min_mult * (d - d2))
 
-    If d <= d2, the grenade never needs to go above ramp_vel,
-    so we need a different formula.
+    If d <= d2, the grenade never needs to go above ramp_vel, so v0 is
+    read off the Phase 2 lookup table (see short_throw_table).
+
+    target_distance may be a scalar or an array of targets; the result
+    has the same shape (a float for a scalar).
     """
     d2 = calculate_d2(ground_friction, min_mult, ramp_vel)
+    targets = np.asarray(target_distance, dtype=float)
 
-    if target_distance <= d2:
-        # Short throw - stays in Phase 2 (variable friction zone)
-        # Use binary search for accuracy
-        return find_speed_for_distance(target_distance, ground_friction, min_mult, ramp_vel)
+    # Short throw - stays in Phase 2 (variable friction zone)
+    distances, speeds = short_throw_table(ground_friction, min_mult, ramp_vel)
+    short = np.interp(targets, distances, speeds)
 
     # Long throw - uses both phases
-    d1_needed = target_distance - d2
+    d1_needed = np.maximum(targets - d2, 0.0)
     effective_friction_phase1 = ground_friction * min_mult
-    v0_squared = ramp_vel * ramp_vel + 2.0 * effective_friction_phase1 * d1_needed
-    return math.sqrt(v0_squared)
+    ramp_vel_sq = ramp_vel * ramp_vel
+    v0_squared = ramp_vel_sq + 2.0 * effective_friction_phase1 * d1_needed
+    result = np.where(targets <= d2, short, np.sqrt(v0_squared))
+    return result if result.ndim else float(result)
 
 
 print("=" * 80)
@@ -129,14 +196,18 @@ for friction in [300.0, 280.0]:
     print(f"{'Target':>10} {'Binary':>10} {'Analyt':>10} {'Match':>8} {'Sim Dist':>10}")
     print("-" * 55)
 
-    for target in [50, 100, 150, 200, 300, 400, 500, 600, 800, 1000, 1200]:
-        binary_speed = find_speed_for_distance(target, friction)
-        analyt_speed = analytical_speed(target, friction)
-
-        sim_dist = simulate(analyt_speed, friction)
-        match = abs(binary_speed - analyt_speed) < 1.0
+    targets = np.array([50, 100, 150, 200, 300, 400, 500, 600, 800, 1000, 1200], dtype=float)
+    analyt_speeds = analytical_speed(targets, friction)
+    # The binary search and the simulation are the per-target references
+    binary_speeds = np.array([find_speed_for_distance(t, friction) for t in targets])
+    sim_dists = [simulate(v, friction) for v in analyt_speeds]
+    matches = np.abs(binary_speeds - analyt_speeds) < 1.0
 
-        print(f"{target:>10.0f} {binary_speed:>10.1f} {analyt_speed:>10.1f} {'✓' if match else '✗':>8} {sim_dist:>10.1f}")
+    print("\n".join(
+        f"{target:>10.0f} {binary_speed:>10.1f} {analyt_speed:>10.1f} {'✓' if match else '✗':>8} {sim_dist:>10.1f}"
+        for target, binary_speed, analyt_speed, match, sim_dist
+        in zip(targets, binary_speeds, analyt_speeds, matches, sim_dists)
+    ))
 
 print()
 print("=" * 80)
@@ -258,13 +329,12 @@ mm = 0.5
 # d = integral_0^V v / f(v) dv where f(v) = gf * (mm + (1-mm)*(1-(v/V)^2))
 n_steps = 10000
 dv = v_ramp / n_steps
-integral = 0.0
-for i in range(n_steps):
-    v = (i + 0.5) * dv
-    t = v / v_ramp
-    fmult = mm + (1.0 - mm) * (1.0 - t * t)
-    fric = gf * fmult
-    integral += v / fric * dv
+# Midpoint rule, evaluated at every step midpoint at once
+v = (np.arange(n_steps) + 0.5) * dv
+t = v / v_ramp
+fmult = mm + (1.0 - mm) * (1.0 - t * t)
+fric = gf * fmult
+integral = float(np.sum(v / fric * dv))
 
 print(f"Phase 2 distance (numerical integration): {integral:.1f} px")
 print(f"Phase 2 distance (simulation): {d2_300:.1f} px")
@@ -2,63 +2,134 @@
 """
 Fix barrel seam on revolver_topdown.png
 This script creates a seamless barrel extension by properly blending the barrel section.
+
+All three attempts (see docs/case-studies/issue-646) are described here as
+column layouts and rendered with extend_barrel(); fix_barrel_seam_v2.py and
+fix_barrel_seam_v3.py are thin wrappers that keep their own comparison copies.
+
+Each layout lists, for every output column, the original column it is copied
+from, so the extended sprite is a single gather from the original pixels:
+- 'stretch' (v1): nearest-neighbor stretch of the barrel to 2x its length
+- 'tile' (v2): the whole barrel, then its middle section repeated
+- 'tile_middle' (v3): barrel start, repeated middle pattern, barrel end
 """
 
+import functools
+
 from PIL import Image
 import numpy as np
 
-# Load the original revolver (before extension)
-original = Image.open('/tmp/original_revolver_topdown.png')
-orig_data = np.array(original)
-
-print(f"Original dimensions: {original.size}")
-
-# The original barrel ends around x=22 (approximately)
-# The cylinder is roughly at x=10-15
-# We need to extend from x=22 to approximately x=33 (doubling the barrel from ~11px to ~22px)
-
-# Create new image with extended width (45x14)
-new_width = 45
-new_height = 14
-new_img = Image.new('RGBA', (new_width, new_height), (0, 0, 0, 0))
-new_data = np.array(new_img)
-
-# Copy the grip and cylinder part (first ~15 pixels)
-new_data[:, :15] = orig_data[:, :15]
-
-# For the barrel, we need to extend it smoothly
-# The barrel section in the original goes from about x=15 to x=22
-# We want to extend it to go from x=15 to x=33 (doubling the length)
-
-# Find the barrel pixels in the original
-barrel_start_x = 15
-barrel_end_x = 22
-original_barrel_length = barrel_end_x - barrel_start_x  # ~7 pixels
-
-# Target barrel length (doubled)
-new_barrel_length = original_barrel_length * 2  # ~14 pixels
-new_barrel_end_x = barrel_start_x + new_barrel_length  # ~29
-
-# Copy and stretch the barrel section
-for x in range(barrel_start_x, new_barrel_end_x):
-    # Map new x position to original x position
-    orig_x = int(barrel_start_x + (x - barrel_start_x) * original_barrel_length / new_barrel_length)
-    orig_x = min(orig_x, barrel_end_x - 1)
-    new_data[:, x] = orig_data[:, orig_x]
-
-# Copy the barrel tip (sight and end) from the original
-# The tip is roughly the last 5 pixels of the original
-tip_length = 5
-tip_start_orig = orig_data.shape[1] - tip_length
-new_data[:, new_barrel_end_x:new_barrel_end_x + tip_length] = orig_data[:, tip_start_orig:]
-
-# Convert back to image
-result = Image.fromarray(new_data, 'RGBA')
-
-# Save the result
-result.save('/tmp/gh-issue-solver-1770555685141/assets/sprites/weapons/revolver_topdown.png')
-print(f"Saved seamless extended barrel: {result.size}")
-
-# Also save a copy for comparison
-result.save('/tmp/seamless_revolver_topdown.png')
-print("Comparison copy saved to /tmp/seamless_revolver_topdown.png")
+ORIGINAL_PATH = '/tmp/original_revolver_topdown.png'
+OUTPUT_PATH = '/tmp/gh-issue-solver-1770555685141/assets/sprites/weapons/revolver_topdown.png'
+
+# Extended sprite size (45x14)
+NEW_WIDTH = 45
+
+
+@functools.lru_cache(maxsize=None)
+def load_original(path=ORIGINAL_PATH):
+    """Decode the original revolver (before extension) once per process."""
+    data = np.array(Image.open(path))
+    data.flags.writeable = False
+    return data
+
+
+def stretch_columns(orig_width):
+    """v1: copy grip+cylinder, stretch the barrel 2x, append the tip."""
+    # The original barrel ends around x=22 (approximately)
+    # The cylinder is roughly at x=10-15
+    # The barrel section in the original goes from about x=15 to x=22
+    # We want to extend it to go from x=15 to x=29 (doubling the length)
+    barrel_start_x = 15
+    barrel_end_x = 22
+    original_barrel_length = barrel_end_x - barrel_start_x  # ~7 pixels
+    new_barrel_length = original_barrel_length * 2  # ~14 pixels
+
+    # Map every new x position to its original x position
+    stretched = barrel_start_x + np.arange(new_barrel_length) * original_barrel_length // new_barrel_length
+    stretched = np.minimum(stretched, barrel_end_x - 1)
+
+    # The tip (sight and end) is roughly the last 5 pixels of the original
+    tip_length = 5
+    return np.concatenate([
+        np.arange(0, barrel_start_x),
+        stretched,
+        np.arange(orig_width - tip_length, orig_width),
+    ])
+
+
+def tile_columns(orig_width):
+    """v2: copy grip+cylinder and the barrel, repeat the barrel middle, add the tip."""
+    # - Grip/handle: x=0 to ~9, cylinder: x=9 to ~15
+    # - Barrel: x=15 to ~29 (the main barrel section)
+    # - Front sight/tip: x=29 to 33 (end cap)
+    barrel_texture_start = 15
+    barrel_texture_end = 29
+    barrel_texture_length = barrel_texture_end - barrel_texture_start  # ~14 pixels
+
+    # Use the middle section of the barrel (a few pixels in from both ends)
+    # as the repeating pattern, for another 14 pixels
+    barrel_middle_start = 18
+    barrel_middle_end = 26
+    pattern = barrel_middle_start + np.arange(barrel_texture_length) % (barrel_middle_end - barrel_middle_start)
+
+    return np.concatenate([
+        np.arange(0, barrel_texture_start),
+        np.arange(barrel_texture_start, barrel_texture_end),
+        pattern,
+        np.arange(29, 34),
+    ])
+
+
+def tile_middle_columns(orig_width):
+    """v3: grip+cylinder, barrel start, repeated pattern, barrel end, tip."""
+    # Original: 34 pixels wide, target: 45 pixels wide (adding 11 pixels)
+    # Use pixels 18-22 as the repeating pattern (4 pixels wide)
+    extension_length = 11
+    pattern = 18 + np.arange(extension_length) % 4
+
+    return np.concatenate([
+        np.arange(0, 15),   # grip and cylinder
+        np.arange(15, 20),  # first part of barrel
+        pattern,            # barrel extension
+        np.arange(20, 29),  # end of the barrel (9 pixels)
+        np.arange(29, 34),  # front sight/tip (5 pixels)
+    ])
+
+
+LAYOUTS = {
+    'stretch': stretch_columns,
+    'tile': tile_columns,
+    'tile_middle': tile_middle_columns,
+}
+
+
+def extend_barrel(orig_data, method, new_width=NEW_WIDTH):
+    """Return the extended RGBA array for one of the LAYOUTS.
+
+    Columns past the end of the layout stay transparent. A layout wider
+    than new_width does not fit and raises ValueError (as v2 did).
+    """
+    columns = LAYOUTS[method](orig_data.shape[1])
+    new_data = np.zeros((orig_data.shape[0], new_width, 4), dtype=np.uint8)
+    new_data[:, :len(columns)] = orig_data[:, columns]
+    return new_data
+
+
+def main(method='stretch', comparison_path='/tmp/seamless_revolver_topdown.png'):
+    orig_data = load_original()
+    print(f"Original dimensions: {orig_data.shape[1]}x{orig_data.shape[0]}")
+
+    result = Image.fromarray(extend_barrel(orig_data, method), 'RGBA')
+
+    # Save the result
+    result.save(OUTPUT_PATH)
+    print(f"Saved seamless extended barrel: {result.size}")
+
+    # Also save a copy for comparison
+    result.save(comparison_path)
+    print(f"Comparison copy saved to {comparison_path}")
+
+
+if __name__ == '__main__':
+    main('stretch')
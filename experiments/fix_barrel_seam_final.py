@@ -11,9 +11,7 @@ Usage:
     python3 experiments/fix_barrel_seam_final.py
 """
 from PIL import Image
-
-# Load the extended barrel sprite (from commit b7839a54)
-img = Image.open('assets/sprites/weapons/revolver_topdown.png')
+import numpy as np
 
 # Column 33 is the seam - it has outline color (30,30,30) where it should
 # have barrel body colors. The barrel body rows are 5-8:
@@ -23,15 +21,26 @@ img = Image.open('assets/sprites/weapons/revolver_topdown.png')
 #   Row 8: shadow   (35, 35, 40)  = 0x232328
 # Rows 4 and 9 are outlines (30,30,30) which are correct as-is.
 
-seam_fixes = {
-    5: (0x46, 0x46, 0x4b, 255),  # barrel highlight
-    6: (0x32, 0x32, 0x37, 255),  # barrel body
-    7: (0x32, 0x32, 0x37, 255),  # barrel body
-    8: (0x23, 0x23, 0x28, 255),  # barrel bottom shadow
-}
+# Rows 5-8 of column 33, top to bottom, written as one band
+SEAM_FIX = np.array([
+    (0x46, 0x46, 0x4b, 255),  # barrel highlight
+    (0x32, 0x32, 0x37, 255),  # barrel body
+    (0x32, 0x32, 0x37, 255),  # barrel body
+    (0x23, 0x23, 0x28, 255),  # barrel bottom shadow
+], dtype=np.uint8)
+
+
+def fix_seam(arr):
+    """Paint the barrel body over the seam column of an extended RGBA array, in place."""
+    arr[5:9, 33] = SEAM_FIX
+    return arr
+
 
-for y, color in seam_fixes.items():
-    img.putpixel((33, y), color)
+if __name__ == '__main__':
+    # Load the extended barrel sprite (from commit b7839a54)
+    img = Image.open('assets/sprites/weapons/revolver_topdown.png')
+    arr = fix_seam(np.array(img.convert('RGBA')))
 
-img.save('assets/sprites/weapons/revolver_topdown.png')
-print(f"Fixed barrel seam at column 33. Sprite size: {img.size}")
+    img = Image.fromarray(arr, 'RGBA')
+    img.save('assets/sprites/weapons/revolver_topdown.png')
+    print(f"Fixed barrel seam at column 33. Sprite size: {img.size}")
@@ -9,10 +9,18 @@ This script creates:
 - shotgun_topdown.png - Completely metal/iron colored main body
 """
 
-from PIL import Image
+import sys
 
-# Color palette - using only metal colors for main body
+import numpy as np
+
+from sprite_gen import build_indexed, spec_key, is_up_to_date, mark_up_to_date, save_png
+
+SIZE = (64, 16)
+
+# Color palette - using only metal colors for main body. 'transparent' comes
+# first so that index 0 of PALETTE is the empty pixel
 COLORS = {
+    'transparent': (0, 0, 0, 0),
     'black': (30, 30, 30, 255),
     'dark_gray': (45, 45, 45, 255),
     'medium_gray': (60, 60, 60, 255),
@@ -23,94 +31,80 @@ COLORS = {
     'metal_medium': (50, 50, 55, 255),
     'metal_light': (70, 70, 75, 255),
     'metal_highlight': (85, 85, 90, 255),
-    'transparent': (0, 0, 0, 0),
 }
 
-
-def create_metal_shotgun_topdown():
-    """
-    Create 64x16 top-down view shotgun sprite.
-    Completely metal/iron colored - no wood parts.
-    Layout: [stock] [receiver] [forend area] [barrel]
-
-    The pump (wood-colored movable part) is a separate sprite.
-    """
-    width, height = 64, 16
-    img = Image.new('RGBA', (width, height), COLORS['transparent'])
-
-    # Pump-action shotgun top-down layout (pointing right):
-    # [stock] [receiver] [magazine tube area] [barrel]
-    # All metal colored now
-
-    # Stock (metal, rear part) - x: 0-12
-    for y in range(5, 11):
-        for x in range(0, 13):
-            if y == 5 or y == 10:
-                if x >= 3:
-                    img.putpixel((x, y), COLORS['black'])
-            elif y in [6, 9]:
-                if x >= 1:
-                    img.putpixel((x, y), COLORS['black'] if x <= 1 else COLORS['metal_dark'])
-            else:  # y in [7, 8] - center of stock
-                if x >= 0:
-                    img.putpixel((x, y), COLORS['metal_medium'] if x > 0 else COLORS['black'])
+# The sprite is drawn as 1-byte palette indices and expanded to RGBA once
+PALETTE = np.array(list(COLORS.values()), dtype=np.uint8)
+INDEX = {name: i for i, name in enumerate(COLORS)}
+
+# Pump-action shotgun top-down layout (pointing right):
+# [stock] [receiver] [magazine tube area] [barrel]
+# All metal colored now
+SPEC = [
+    # Stock (metal, rear part) - x: 0-12, tapering towards the butt
+    ('rect', (3, 5, 13, 6), INDEX['black']),
+    ('rect', (3, 10, 13, 11), INDEX['black']),
+    ('rect', (2, 6, 13, 10), INDEX['metal_dark']),
+    ('rect', (1, 6, 2, 10), INDEX['black']),
+    # Center of stock
+    ('rect', (1, 7, 13, 9), INDEX['metal_medium']),
+    ('rect', (0, 7, 1, 9), INDEX['black']),
 
     # Receiver (metal body) - x: 13-30
-    for y in range(4, 12):
-        for x in range(13, 31):
-            if y == 4 or y == 11:
-                img.putpixel((x, y), COLORS['black'])
-            elif y in [5, 10]:
-                img.putpixel((x, y), COLORS['dark_gray'])
-            else:
-                img.putpixel((x, y), COLORS['medium_gray'])
+    ('rect', (13, 4, 31, 12), INDEX['medium_gray']),
+    ('rect', (13, 5, 31, 6), INDEX['dark_gray']),
+    ('rect', (13, 10, 31, 11), INDEX['dark_gray']),
+    ('rect', (13, 4, 31, 5), INDEX['black']),
+    ('rect', (13, 11, 31, 12), INDEX['black']),
 
     # Trigger guard area - small detail at bottom
-    for y in range(12, 15):
-        for x in range(18, 25):
-            if y == 12:
-                img.putpixel((x, y), COLORS['black'])
-            elif x == 18 or x == 24:
-                img.putpixel((x, y), COLORS['black'])
-            elif y == 14:
-                img.putpixel((x, y), COLORS['black'])
+    ('outline', (18, 12, 25, 15), INDEX['black']),
 
     # Magazine tube area / forend base (metal) - x: 31-45
     # This is the area where the pump slides - it's metal under the pump
-    for y in range(5, 11):
-        for x in range(31, 46):
-            if y == 5 or y == 10:
-                img.putpixel((x, y), COLORS['black'])
-            elif y in [6, 9]:
-                img.putpixel((x, y), COLORS['metal_dark'])
-            else:  # middle part
-                img.putpixel((x, y), COLORS['metal_medium'])
+    ('rect', (31, 5, 46, 11), INDEX['metal_medium']),
+    ('rect', (31, 6, 46, 7), INDEX['metal_dark']),
+    ('rect', (31, 9, 46, 10), INDEX['metal_dark']),
+    ('rect', (31, 5, 46, 6), INDEX['black']),
+    ('rect', (31, 10, 46, 11), INDEX['black']),
 
     # Barrel (metal tube) - x: 46-63
-    for y in range(6, 10):
-        for x in range(46, 64):
-            if y == 6 or y == 9:
-                img.putpixel((x, y), COLORS['black'])
-            else:
-                img.putpixel((x, y), COLORS['light_gray'])
+    ('rect', (46, 6, 64, 10), INDEX['light_gray']),
+    ('rect', (46, 6, 64, 7), INDEX['black']),
+    ('rect', (46, 9, 64, 10), INDEX['black']),
 
     # Muzzle end detail
-    for y in range(5, 11):
-        img.putpixel((63, y), COLORS['black'])
+    ('rect', (63, 5, 64, 11), INDEX['black']),
+]
+
+
+def create_metal_shotgun_topdown():
+    """
+    Create 64x16 top-down view shotgun sprite.
+    Completely metal/iron colored - no wood parts.
+    Layout: [stock] [receiver] [forend area] [barrel]
 
-    return img
+    The pump (wood-colored movable part) is a separate sprite.
+    """
+    return build_indexed(SIZE, SPEC, PALETTE)
 
 
 if __name__ == '__main__':
+    outputs = ['experiments/shotgun_topdown_metal.png', 'assets/sprites/weapons/shotgun_topdown.png']
+    # SPEC only holds palette indices, so the colours are part of the key
+    key = spec_key(SIZE, (SPEC, PALETTE.tolist()))
+    if is_up_to_date(outputs, key):
+        print("shotgun_topdown_metal.png is up to date, nothing to do")
+        sys.exit(0)
+
     # Create the metal shotgun sprite
     topdown = create_metal_shotgun_topdown()
 
-    # Save to experiments folder first
-    topdown.save('experiments/shotgun_topdown_metal.png')
+    # Save to experiments folder first, then copy the file to assets
+    save_png(topdown, outputs)
+    mark_up_to_date(outputs, key)
     print(f"Created shotgun_topdown_metal.png: {topdown.size}")
 
-    # Also save to assets folder
-    topdown.save('assets/sprites/weapons/shotgun_topdown.png')
     print("\nSprites saved to:")
     print("  - experiments/shotgun_topdown_metal.png")
     print("  - assets/sprites/weapons/shotgun_topdown.png")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Regenerate the code-drawn weapon sprites in a single process.
+
+Pillow and NumPy are imported once and shared by every generator instead of
+being paid for by one interpreter per script. Each sprite is skipped when its
+outputs already exist and were written for the current spec and encoding,
+using the same CACHE_KEY as the sprite's own script (see the cache helpers in
+sprite_gen.py), so running either one leaves the other up to date.
+
+Outputs under assets/ are written with full PNG optimisation, like the
+standalone scripts do; pass --draft to use fast draft compression for every
+output while iterating. With --jobs N the stale sprites are rendered in N
+worker processes; encoding and the cache bookkeeping stay in the main process.
+
+Usage (from any directory):
+    python experiments/generate_all_sprites.py [--draft] [--jobs N]
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+from sprite_gen import is_up_to_date, mark_up_to_date, save_png, DRAFT_PNG
+import create_makarov_icon
+import create_makarov_sprite
+import create_mini_uzi_icon
+import create_silenced_pistol_icon
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+WEAPONS_DIR = os.path.join(PROJECT_DIR, "assets", "sprites", "weapons")
+
+# (name, render function, cache key, output paths)
+SPRITES = [
+    (
+        "makarov_pm_icon",
+        create_makarov_icon.create_makarov_icon,
+        create_makarov_icon.CACHE_KEY,
+        [os.path.join(WEAPONS_DIR, "makarov_pm_icon.png")],
+    ),
+    (
+        "makarov_pm_topdown",
+        create_makarov_sprite.create_makarov_sprite,
+        create_makarov_sprite.CACHE_KEY,
+        [os.path.join(WEAPONS_DIR, "makarov_pm_topdown.png")],
+    ),
+    (
+        "mini_uzi_icon",
+        create_mini_uzi_icon.create_mini_uzi_icon,
+        create_mini_uzi_icon.CACHE_KEY,
+        [
+            os.path.join(SCRIPT_DIR, "mini_uzi_icon.png"),
+            os.path.join(WEAPONS_DIR, "mini_uzi_icon.png"),
+        ],
+    ),
+    (
+        "silenced_pistol_icon",
+        create_silenced_pistol_icon.create_silenced_pistol_icon,
+        create_silenced_pistol_icon.CACHE_KEY,
+        [
+            os.path.join(SCRIPT_DIR, "silenced_pistol_icon.png"),
+            os.path.join(WEAPONS_DIR, "silenced_pistol_icon.png"),
+        ],
+    ),
+]
+
+
+def main():
+    """Render every sprite whose outputs are missing or stale."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--draft", action="store_true",
+                        help="encode every output with fast draft compression, assets included")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="render stale sprites in this many worker processes")
+    args = parser.parse_args()
+    # None lets sprite_gen pick the encoding from each sprite's output paths
+    save_options = DRAFT_PNG if args.draft else None
+
+    stale = []
+    for name, render, key, outputs in SPRITES:
+        if is_up_to_date(outputs, key, save_options):
+            print(f"  Up to date: {name}")
+        else:
+            stale.append((name, render, key, outputs))
+
+    renders = [render for _, render, _, _ in stale]
+    if args.jobs > 1 and len(stale) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = [pool.submit(render) for render in renders]
+            images = [future.result() for future in futures]
+    else:
+        images = [render() for render in renders]
+
+    for (name, _, key, outputs), img in zip(stale, images):
+        save_png(img, outputs, save_options)
+        mark_up_to_date(outputs, key, save_options)
+        print(f"  Saved: {name} ({img.width}x{img.height}) -> {len(outputs)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
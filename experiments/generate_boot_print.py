@@ -63,9 +63,7 @@ def create_boot_print(width=11, height=20, output_path="boot_print.png"):
         x_left = max(0, center_x - actual_half)
         x_right = min(width - 1, center_x + actual_half)
 
-        for x in range(x_left, x_right + 1):
-            # Slight variation for organic feel
-            img.putpixel((x, y), blood_main)
+        draw.line([(x_left, y), (x_right, y)], fill=blood_main)
 
     # Second pass: add horizontal tread gaps (make them transparent)
     # Scaled for smaller texture: 2 pixels spacing, 1 pixel gap
@@ -86,9 +84,9 @@ def create_boot_print(width=11, height=20, output_path="boot_print.png"):
 
         # Draw the tread gap
         for gap in range(tread_gap):
-            if tread_y + gap < sole_bottom - 1:
-                for x in range(x_left, x_right + 1):
-                    img.putpixel((x, tread_y + gap), transparent)
+            if tread_y + gap < sole_bottom - 1 and x_left <= x_right:
+                # ImageDraw writes RGBA values as-is, so this clears the span
+                draw.line([(x_left, tread_y + gap), (x_right, tread_y + gap)], fill=transparent)
 
     # Third pass: darken edges for definition
     for y in range(sole_top, sole_bottom):
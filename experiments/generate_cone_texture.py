@@ -18,7 +18,9 @@ The resulting texture is used by Godot's PointLight2D as its light mask.
 """
 
 import math
+
 from PIL import Image
+import numpy as np
 
 SIZE = 2048
 HALF_ANGLE_DEG = 9.0  # 18 degrees total = 9 each side
@@ -29,87 +31,89 @@ OUTPUT_PATH = "../assets/sprites/effects/flashlight_cone_18deg.png"
 
 
 def sample_intensity(sx, sy, center_x, center_y, max_radius):
-    """Compute light intensity for a single sub-pixel sample point."""
+    """Compute light intensity at sub-pixel sample points.
+
+    sx and sy are NumPy arrays of sample coordinates (or anything that
+    broadcasts); the result is a float64 array of the same shape.
+    """
     dx = sx - center_x
     dy = sy - center_y
-    dist = math.sqrt(dx * dx + dy * dy)
-
-    if dist == 0:
-        return 1.0
-
-    if dist > max_radius:
-        return 0.0
+    dist = np.sqrt(dx * dx + dy * dy)
 
     # Angle from +X axis (0 = right)
-    angle = abs(math.atan2(dy, dx))
-
-    if angle > HALF_ANGLE_RAD:
-        return 0.0
+    angle = np.abs(np.arctan2(dy, dx))
 
     # Distance falloff: brighter near center, fading toward edge
-    dist_factor = 1.0 - (dist / max_radius)
-    dist_factor = max(0.0, min(1.0, dist_factor))
+    dist_factor = np.clip(1.0 - (dist / max_radius), 0.0, 1.0)
 
-    # Angular falloff: soft edges at cone boundary
-    ang_factor = 1.0 - (angle / HALF_ANGLE_RAD)
-    ang_factor = math.pow(ang_factor, 0.5)  # gentle roll-off
+    # Angular falloff: soft edges at cone boundary. Samples outside the
+    # cone are masked below, the clamp only keeps their power() finite
+    ang_factor = np.maximum(1.0 - (angle / HALF_ANGLE_RAD), 0.0)
+    ang_factor = np.power(ang_factor, 0.5)  # gentle roll-off
 
-    return dist_factor * ang_factor
+    intensity = np.where((dist > max_radius) | (angle > HALF_ANGLE_RAD), 0.0, dist_factor * ang_factor)
+    return np.where(dist == 0, 1.0, intensity)
 
 
 def generate_cone_texture():
-    img = Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
-    pixels = img.load()
-
     center_x = SIZE / 2.0
     center_y = SIZE / 2.0
     max_radius = SIZE / 2.0
 
     total_samples = SAMPLES * SAMPLES
 
-    for y in range(SIZE):
-        for x in range(SIZE):
-            # Quick reject: if even the closest corner of this pixel
-            # is outside the max radius, skip entirely
-            dx = x - center_x
-            dy = y - center_y
-            rough_dist = math.sqrt(dx * dx + dy * dy)
-
-            if rough_dist > max_radius + 1.5:
-                continue
-
-            # Quick reject: if this pixel is far from the cone edge,
-            # we can skip supersampling and just sample the center
-            rough_angle = abs(math.atan2(dy, dx)) if rough_dist > 0 else 0.0
-            # Pixel angular width at this distance (how much angle one pixel spans)
-            pixel_ang_width = (1.0 / max(rough_dist, 1.0))
-
-            if rough_angle > HALF_ANGLE_RAD + pixel_ang_width * 2:
-                # Well outside the cone - skip
-                continue
-
-            if rough_angle < HALF_ANGLE_RAD - pixel_ang_width * 2 and rough_dist < max_radius - 2:
-                # Well inside the cone - no need for supersampling
-                intensity = sample_intensity(x + 0.5, y + 0.5, center_x, center_y, max_radius)
-                alpha = int(intensity * 255)
-                if alpha > 0:
-                    pixels[x, y] = (255, 255, 255, alpha)
-                continue
-
-            # Near the cone edge or radius edge - use supersampling
-            total_intensity = 0.0
-            for sy in range(SAMPLES):
-                for sx in range(SAMPLES):
-                    sub_x = x + (sx + 0.5) / SAMPLES
-                    sub_y = y + (sy + 0.5) / SAMPLES
-                    total_intensity += sample_intensity(
-                        sub_x, sub_y, center_x, center_y, max_radius
-                    )
-
-            intensity = total_intensity / total_samples
-            alpha = int(intensity * 255)
-            if alpha > 0:
-                pixels[x, y] = (255, 255, 255, alpha)
+    # Only the lower-right bounding box of the cone can be lit: every lit
+    # sample is at most max_radius * tan(HALF_ANGLE_RAD) from the axis and
+    # right of the center (left of it the angle exceeds 90 degrees)
+    y_span = int(max_radius * math.tan(HALF_ANGLE_RAD)) + 2
+    y0 = max(int(center_y) - y_span, 0)
+    y1 = min(int(center_y) + y_span + 1, SIZE)
+    x0 = int(center_x)
+
+    # The box is classified at once; the open (h, 1) and (1, w) coordinate
+    # grids broadcast, so no full-size coordinate arrays are built
+    yy, xx = np.ogrid[y0:y1, x0:SIZE]
+    dx = xx - center_x
+    dy = yy - center_y
+    rough_dist = np.sqrt(dx * dx + dy * dy)
+    rough_angle = np.abs(np.arctan2(dy, dx))
+    # Pixel angular width at this distance (how much angle one pixel spans)
+    pixel_ang_width = 1.0 / np.maximum(rough_dist, 1.0)
+
+    # Quick reject: pixels beyond the max radius or well outside the cone
+    # stay transparent
+    lit = (rough_dist <= max_radius + 1.5) & (rough_angle <= HALF_ANGLE_RAD + pixel_ang_width * 2)
+
+    # Well inside the cone - no need for supersampling, sample the center
+    inside = lit & (rough_angle < HALF_ANGLE_RAD - pixel_ang_width * 2) & (rough_dist < max_radius - 2)
+    # Near the cone edge or radius edge - use supersampling
+    edge = lit & ~inside
+
+    intensity = np.zeros(lit.shape)
+    iy, ix = np.nonzero(inside)
+    intensity[iy, ix] = sample_intensity(x0 + ix + 0.5, y0 + iy + 0.5, center_x, center_y, max_radius)
+
+    # Sub-samples are accumulated one offset at a time, in the same order
+    # for every edge pixel
+    ey, ex = np.nonzero(edge)
+    total_intensity = np.zeros(len(ey))
+    for sy in range(SAMPLES):
+        for sx in range(SAMPLES):
+            sub_x = (x0 + ex) + (sx + 0.5) / SAMPLES
+            sub_y = (y0 + ey) + (sy + 0.5) / SAMPLES
+            total_intensity += sample_intensity(
+                sub_x, sub_y, center_x, center_y, max_radius
+            )
+    intensity[ey, ex] = total_intensity / total_samples
+
+    # White where lit, with the intensity as alpha; everything else,
+    # including the whole texture outside the box, stays (0, 0, 0, 0)
+    alpha = np.zeros((SIZE, SIZE), dtype=np.uint8)
+    alpha[y0:y1, x0:] = (intensity * 255).astype(np.uint8)
+    rgba = np.zeros((SIZE, SIZE, 4), dtype=np.uint8)
+    rgba[alpha > 0, :3] = 255
+    rgba[:, :, 3] = alpha
+    img = Image.fromarray(rgba, "RGBA")
 
     img.save(OUTPUT_PATH)
     print(f"Generated cone texture: {OUTPUT_PATH}")
@@ -119,7 +123,7 @@ def generate_cone_texture():
 
     # Verify: count non-transparent pixels
     total = SIZE * SIZE
-    non_zero = sum(1 for y in range(SIZE) for x in range(SIZE) if pixels[x, y][3] > 0)
+    non_zero = np.count_nonzero(alpha)
     print(f"  Non-transparent pixels: {non_zero}/{total} ({100*non_zero/total:.1f}%)")
 
 
@@ -82,49 +82,35 @@ def draw_bullet(img, bx, by):
     - Cylindrical body (teal/cyan)
     - Brass casing on the left
     """
+    # Solid runs are filled with img.paste(color, box) - one C-level fill per
+    # rectangle (box is end-exclusive) instead of a putpixel per pixel
+
     # --- Casing (left portion) - brass colored ---
-    for dy in range(-2, 3):
-        put(img, bx - 7, by + dy, OUTLINE)
-        put(img, bx - 6, by + dy, CASING_DARK)
-        put(img, bx - 5, by + dy, CASING)
-        put(img, bx - 4, by + dy, CASING)
-        put(img, bx - 3, by + dy, CASING_HIGHLIGHT if dy <= -1 else CASING)
+    img.paste(OUTLINE, (bx - 7, by - 2, bx - 6, by + 3))
+    img.paste(CASING_DARK, (bx - 6, by - 2, bx - 5, by + 3))
+    img.paste(CASING, (bx - 5, by - 2, bx - 2, by + 3))
+    img.paste(CASING_HIGHLIGHT, (bx - 3, by - 2, bx - 2, by))
     # Casing top/bottom outline
-    for dx in range(-7, -2):
-        put(img, bx + dx, by - 3, OUTLINE)
-        put(img, bx + dx, by + 3, OUTLINE)
+    img.paste(OUTLINE, (bx - 7, by - 3, bx - 2, by - 2))
+    img.paste(OUTLINE, (bx - 7, by + 3, bx - 2, by + 4))
 
     # Neck / crimp between casing and bullet
-    for dy in range(-2, 3):
-        put(img, bx - 2, by + dy, OUTLINE)
-    for dy in range(-1, 2):
-        put(img, bx - 2, by + dy, BULLET_BASE)
-
-    # Bullet body (main cylinder) - teal/cyan, ~7px wide
-    for dx in range(-1, 6):
-        for dy in range(-2, 3):
-            put(img, bx + dx, by + dy, OUTLINE)
-        for dy in range(-1, 2):
-            if dy == -1:
-                c = BULLET_TIP  # top highlight
-            elif dy == 0:
-                c = BULLET_BODY
-            else:
-                c = BULLET_BODY_DARK  # bottom shadow
-            put(img, bx + dx, by + dy, c)
-
-    # Top and bottom outline of body
-    for dx in range(-1, 6):
-        put(img, bx + dx, by - 2, OUTLINE)
-        put(img, bx + dx, by + 2, OUTLINE)
+    img.paste(OUTLINE, (bx - 2, by - 2, bx - 1, by + 3))
+    img.paste(BULLET_BASE, (bx - 2, by - 1, bx - 1, by + 2))
+
+    # Bullet body (main cylinder) - teal/cyan, ~7px wide, with top and
+    # bottom outline rows
+    img.paste(OUTLINE, (bx - 1, by - 2, bx + 6, by + 3))
+    img.paste(BULLET_TIP, (bx - 1, by - 1, bx + 6, by))         # top highlight
+    img.paste(BULLET_BODY, (bx - 1, by, bx + 6, by + 1))
+    img.paste(BULLET_BODY_DARK, (bx - 1, by + 1, bx + 6, by + 2))  # bottom shadow
 
     # Specular highlight line along top of bullet
-    for dx in range(0, 5):
-        put(img, bx + dx, by - 1, BULLET_HIGHLIGHT)
+    img.paste(BULLET_HIGHLIGHT, (bx, by - 1, bx + 5, by))
 
     # Bullet tip (pointed) - narrowing to a point
-    for dy in range(-1, 2):
-        put(img, bx + 6, by + dy, BULLET_BODY if dy >= 0 else BULLET_TIP)
+    img.paste(BULLET_TIP, (bx + 6, by - 1, bx + 7, by))
+    img.paste(BULLET_BODY, (bx + 6, by, bx + 7, by + 2))
     put(img, bx + 6, by - 2, OUTLINE)
     put(img, bx + 6, by + 2, OUTLINE)
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Pack the code-drawn weapon sprites into a single atlas PNG plus a JSON index.
+
+Every generator is imported and rendered in this process, through the same
+steps that produced the shipped PNGs (the revolver barrel extension and seam
+fix, the metal shotgun from fix_shotgun_model.py). The RGBA arrays are laid
+out left to right (top-aligned, 1px transparent gutter) and the strip is
+encoded once, instead of once per sprite. The index maps each sprite name to
+its [x, y, w, h] region in the atlas.
+
+Usage (from any directory):
+    python experiments/pack_atlas.py [--out experiments/weapon_atlas.png]
+"""
+
+import argparse
+import json
+import os
+
+from PIL import Image
+import numpy as np
+
+from sprite_gen import new_canvas, FINAL_PNG
+import create_makarov_icon
+import create_makarov_sprite
+import create_mini_uzi_icon
+import create_pump_sprite
+import create_revolver_sprites
+import create_shotgun_sprites
+import create_silenced_pistol_icon
+import extend_revolver_barrel
+import fix_barrel_seam_final
+import fix_shotgun_model
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def render_revolver_topdown():
+    """The shipped revolver: the base sprite with its extended, seam-fixed barrel."""
+    base = np.array(create_revolver_sprites.create_revolver_topdown())
+    return fix_barrel_seam_final.fix_seam(extend_revolver_barrel.extend_topdown_barrel(base))
+
+
+# (name, render function); names match the sprite file stems in assets/sprites/weapons
+# and each render reproduces that shipped PNG
+SPRITES = [
+    ("makarov_pm_icon", create_makarov_icon.create_makarov_icon),
+    ("makarov_pm_topdown", create_makarov_sprite.create_makarov_sprite),
+    ("mini_uzi_icon", create_mini_uzi_icon.create_mini_uzi_icon),
+    ("revolver_icon", create_revolver_sprites.create_revolver_icon),
+    ("revolver_topdown", render_revolver_topdown),
+    ("shotgun_icon", create_shotgun_sprites.create_shotgun_icon),
+    ("shotgun_topdown", fix_shotgun_model.create_metal_shotgun_topdown),
+    ("shotgun_pump", lambda: create_pump_sprite.make_pump("v3")),
+    ("silenced_pistol_icon", create_silenced_pistol_icon.create_silenced_pistol_icon),
+]
+
+GUTTER = 1  # transparent columns between sprites, avoids filtering bleed
+
+
+def pack_atlas(sprites=SPRITES):
+    """Render the sprites and return (atlas image, {name: [x, y, w, h]})."""
+    arrays = [(name, np.asarray(render())) for name, render in sprites]
+
+    width = sum(a.shape[1] for _, a in arrays) + GUTTER * (len(arrays) - 1)
+    height = max(a.shape[0] for _, a in arrays)
+    atlas = new_canvas(width, height)
+
+    regions = {}
+    x = 0
+    for name, a in arrays:
+        h, w = a.shape[:2]
+        atlas[:h, x:x + w] = a
+        regions[name] = [x, 0, w, h]
+        x += w + GUTTER
+
+    return Image.fromarray(atlas, 'RGBA'), regions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", default=os.path.join(SCRIPT_DIR, "weapon_atlas.png"),
+                        help="atlas PNG path; the index is written next to it as .json")
+    args = parser.parse_args()
+
+    atlas, regions = pack_atlas()
+    atlas.save(args.out, "PNG", **FINAL_PNG)
+    index_path = os.path.splitext(args.out)[0] + ".json"
+    with open(index_path, "w") as f:
+        json.dump(regions, f, indent=2)
+
+    print(f"Packed {len(regions)} sprites into {args.out} ({atlas.width}x{atlas.height})")
+    print(f"Index written to {index_path}")
+
+
+if __name__ == "__main__":
+    main()
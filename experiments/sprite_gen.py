@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Shared drawing primitives for the pixel-art weapon sprite generators.
+
+Sprites are painted into an (height, width, 4) uint8 RGBA NumPy array, so every
+primitive is a single slice or index store instead of a per-pixel putpixel loop.
+A sprite can be described declaratively as a list of operations and rendered
+with build():
+
+    spec = [
+        ('rect', (x0, y0, x1, y1), color),           # filled box, end-exclusive
+        ('rect', (x0, y0, x1, y1), color, (sx, sy)), # every sx-th column / sy-th row
+        ('outline', (x0, y0, x1, y1), color),        # 1px border of the box
+        ('pixels', (xs, ys), color),                 # scatter; xs/ys broadcast
+        ('spans', (rows, starts, ends), color),      # [start, end) run per row
+        ('checker', (x0, y0, x1, y1), (even, odd)),  # even: x and y share parity
+        ('tile', (x0, y0, x1, y1), tile),            # repeat a small RGBA motif
+    ]
+    img = build((width, height), spec)
+
+Operations are applied in order, so later entries paint over earlier ones.
+Specs that only use flat-colour operations are drawn as 1-byte palette
+indices and expanded to RGBA once at the end; build_indexed() does the same
+for a spec whose colours are already indices into a given palette.
+
+These generators always produce the same bytes for the same inputs, so scripts
+can skip regeneration with is_up_to_date()/mark_up_to_date(), keyed by
+spec_key() or source_key(). Delete .sprite_cache.json to force a rebuild.
+save_png() and the cache helpers pick the PNG encoding from the output paths
+(see png_options()) and record it with the key, so a standalone script and
+generate_all_sprites.py agree on which outputs are current.
+"""
+
+import numpy as np
+import functools
+import hashlib
+import json
+import os
+import shutil
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.sprite_cache.json')
+
+# Palette shared by the side-view/top-down weapon sprites. 'transparent' comes
+# first so that index 0 of a palette built from it is the empty pixel.
+WEAPON_COLORS = {
+    'transparent': (0, 0, 0, 0),
+    'black': (30, 30, 30, 255),
+    'dark_gray': (45, 45, 45, 255),
+    'medium_gray': (60, 60, 60, 255),
+    'light_gray': (70, 70, 70, 255),
+    'lighter_gray': (90, 90, 90, 255),
+    'highlight': (100, 100, 100, 255),
+    'metal_dark': (35, 35, 40, 255),
+    'metal_medium': (50, 50, 55, 255),
+    'metal_light': (70, 70, 75, 255),
+    'grip_dark': (50, 40, 30, 255),
+    'grip_medium': (70, 55, 40, 255),
+    'grip_light': (85, 70, 50, 255),
+}
+
+# PNG encoder settings: cheap zlib level 1 while iterating on a sprite, full
+# optimisation for the committed assets
+DRAFT_PNG = {'compress_level': 1, 'optimize': False}
+FINAL_PNG = {'optimize': True}
+
+
+def new_canvas(width, height):
+    """Return a fully transparent RGBA canvas."""
+    return np.zeros((height, width, 4), dtype=np.uint8)
+
+
+def as_words(arr):
+    """View an RGBA canvas as (height, width) uint32 words, one per pixel."""
+    return arr.view(np.uint32)[:, :, 0]
+
+
+@functools.lru_cache(maxsize=None)
+def pack_color(color):
+    """Return an RGBA tuple as the uint32 word it occupies in as_words()."""
+    return np.array(color, dtype=np.uint8).view(np.uint32)[0]
+
+
+@functools.lru_cache(maxsize=None)
+def coord_grid(box):
+    """Open (yy, xx) coordinate grids over box, as np.ogrid would return.
+
+    Cached per box, so sprites regenerated in one process share the arrays;
+    they are read-only to keep a caller from corrupting the shared copy.
+    """
+    x0, y0, x1, y1 = box
+    yy, xx = np.ogrid[y0:y1, x0:x1]
+    yy.flags.writeable = False
+    xx.flags.writeable = False
+    return yy, xx
+
+
+def draw_rect(arr, box, color, step=(1, 1)):
+    """Fill box (x0, y0, x1, y1), end-exclusive like Image.paste boxes."""
+    x0, y0, x1, y1 = box
+    arr[y0:y1:step[1], x0:x1:step[0]] = color
+
+
+def draw_under(arr, box, fill):
+    """Fill only the still-transparent pixels of box, leaving painted ones alone.
+
+    fill is one colour or anything that broadcasts to the box's (h, w, 4)
+    pixels, e.g. an (h, 1, 4) array of per-row shades.
+    """
+    x0, y0, x1, y1 = box
+    sub = arr[y0:y1, x0:x1]
+    empty = sub[:, :, 3] == 0
+    sub[empty] = np.broadcast_to(np.asarray(fill, dtype=np.uint8), sub.shape)[empty]
+
+
+def draw_hline(arr, y, x0, x1, color):
+    """Draw a horizontal run of pixels x0 <= x < x1 on row y."""
+    arr[y, x0:x1] = color
+
+
+def draw_vline(arr, x, y0, y1, color):
+    """Draw a vertical run of pixels y0 <= y < y1 on column x."""
+    arr[y0:y1, x] = color
+
+
+def draw_outline(arr, box, color):
+    """Draw the 1px border just inside box (x0, y0, x1, y1), end-exclusive."""
+    x0, y0, x1, y1 = box
+    arr[y0, x0:x1] = color
+    arr[y1 - 1, x0:x1] = color
+    arr[y0:y1, x0] = color
+    arr[y0:y1, x1 - 1] = color
+
+
+def draw_spans(arr, spans, color):
+    """Fill x in [starts[i], ends[i]) on each row rows[i], in one scatter store.
+
+    spans is (rows, starts, ends); scalars broadcast against the arrays.
+    """
+    rows, starts, ends = np.broadcast_arrays(*spans)
+    rows = np.asarray(rows).reshape(-1, 1)
+    starts = np.asarray(starts).reshape(-1, 1)
+    ends = np.asarray(ends).reshape(-1, 1)
+    xs = np.arange(starts.min(), ends.max())
+    row_idx, col_idx = np.nonzero((xs >= starts) & (xs < ends))
+    arr[rows[row_idx, 0], xs[col_idx]] = color
+
+
+def draw_pixels(arr, xy, color):
+    """Scatter color at the (xs, ys) coordinates; xs and ys broadcast."""
+    xs, ys = xy
+    arr[ys, xs] = color
+
+
+def make_tile(rows):
+    """Build a small (th, tw, 4) motif from a nested list of RGBA colours."""
+    return np.asarray(rows, dtype=np.uint8)
+
+
+def draw_tile(arr, box, tile):
+    """Repeat tile across box, anchored at its top-left corner, in one store."""
+    x0, y0, x1, y1 = box
+    h, w = y1 - y0, x1 - x0
+    th, tw = tile.shape[:2]
+    reps = (-(-h // th), -(-w // tw), 1)
+    arr[y0:y1, x0:x1] = np.tile(tile, reps)[:h, :w]
+
+
+def draw_checker(arr, box, colors):
+    """Fill box with a 1px checkerboard; colors is (same_parity, other_parity)."""
+    x0, y0 = box[:2]
+    even, odd = colors
+    # The 2x2 motif is phased so that "even" lands where x and y share parity
+    # in absolute canvas coordinates, not relative to the box corner
+    if (x0 ^ y0) & 1:
+        even, odd = odd, even
+    draw_tile(arr, box, make_tile([[even, odd], [odd, even]]))
+
+
+def draw_ellipse_bands(arr, box, center, radii, fill, bands):
+    """Fill the ellipse (center, radii) clipped to box, then paint its rim bands.
+
+    fill is one colour or anything that broadcasts to the box's (h, w, 4)
+    pixels, e.g. an (h, 1, 4) array of per-row shades. bands lists
+    (threshold, color) pairs from the centre outwards: every pixel whose
+    normalised squared distance exceeds threshold takes that colour.
+    """
+    x0, y0, x1, y1 = box
+    cx, cy = center
+    rx, ry = radii
+    yy, xx = coord_grid(box)
+    dx = (xx - cx) / rx
+    dy = (yy - cy) / ry
+    dist = dx * dx + dy * dy
+    inside = dist <= 1.0
+
+    sub = arr[y0:y1, x0:x1]
+    sub[inside] = np.broadcast_to(np.asarray(fill, dtype=np.uint8), sub.shape)[inside]
+    for threshold, color in bands:
+        sub[inside & (dist > threshold)] = color
+
+
+# Ops that take a single flat colour; paint() runs them on the uint32 word
+# view so each pixel is one 4-byte store instead of a 4-channel broadcast
+WORD_OPS = {'rect', 'outline', 'pixels', 'spans'}
+
+OPS = {
+    'rect': draw_rect,
+    'outline': draw_outline,
+    'pixels': draw_pixels,
+    'spans': draw_spans,
+    'checker': draw_checker,
+    'tile': draw_tile,
+}
+
+
+def paint(arr, spec):
+    """Apply the operations of a sprite spec to an existing canvas."""
+    words = as_words(arr)
+    for op, target, color, *rest in spec:
+        if op in WORD_OPS:
+            OPS[op](words, target, pack_color(color), *rest)
+        else:
+            OPS[op](arr, target, color, *rest)
+    return arr
+
+
+def build(size, spec):
+    """Render a sprite spec onto a transparent canvas of size (width, height)."""
+    # Imported here so that cache hits (see is_up_to_date) never load Pillow
+    from PIL import Image
+
+    if all(op in WORD_OPS for op, *_ in spec):
+        # Flat colours only: paint 1-byte palette indices instead of 4-byte
+        # pixels and expand to RGBA once
+        colors = list(dict.fromkeys(color for _, _, color, *_ in spec))
+        if len(colors) < 256:
+            lookup = {color: i for i, color in enumerate(colors, start=1)}
+            indexed = [(op, target, lookup[color], *rest) for op, target, color, *rest in spec]
+            return build_indexed(size, indexed, [(0, 0, 0, 0)] + colors)
+
+    arr = paint(new_canvas(*size), spec)
+    return Image.fromarray(arr, 'RGBA')
+
+
+def build_indexed(size, spec, palette):
+    """Render a flat-colour spec whose colours are indices into palette.
+
+    The spec is painted on a (height, width) uint8 canvas and expanded to RGBA
+    with one palette lookup; palette[0] must be the transparent colour.
+    """
+    from PIL import Image
+
+    width, height = size
+    idx = np.zeros((height, width), dtype=np.uint8)
+    for op, target, color, *rest in spec:
+        OPS[op](idx, target, color, *rest)
+    return Image.fromarray(np.asarray(palette, dtype=np.uint8)[idx], 'RGBA')
+
+
+def _is_asset(path):
+    return 'assets' in os.path.abspath(path).split(os.sep)
+
+
+def png_options(paths):
+    """FINAL_PNG when any of paths is under an assets/ directory, else DRAFT_PNG."""
+    return FINAL_PNG if any(_is_asset(p) for p in paths) else DRAFT_PNG
+
+
+def save_png(img, paths, options=None):
+    """Encode img once to paths[0] and copy the file bytes to the other paths.
+
+    options defaults to png_options(paths).
+    """
+    if options is None:
+        options = png_options(paths)
+    img.save(paths[0], 'PNG', **options)
+    for path in paths[1:]:
+        shutil.copyfile(paths[0], path)
+
+
+def _digest(*chunks):
+    """SHA-256 over the given byte chunks plus this module's own source."""
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def spec_key(size, spec):
+    """Cache key for a spec-driven sprite; changes with any size, coordinate or colour."""
+    return _digest(repr((size, spec)).encode())
+
+
+def source_key(*paths):
+    """Cache key for a sprite drawn by code: a hash of its source files and input images."""
+    chunks = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            chunks.append(f.read())
+    return _digest(*chunks)
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _output_key(paths, key, options):
+    # Draft and final encodings differ in bytes, so they are cached separately
+    if options is None:
+        options = png_options(paths)
+    return f"{key}-{'final' if options == FINAL_PNG else 'draft'}"
+
+
+def is_up_to_date(paths, key, options=None):
+    """True when every output exists and was last written for this key and encoding.
+
+    options is the PNG encoding the outputs would be saved with, as for save_png().
+    """
+    key = _output_key(paths, key, options)
+    cache = _load_cache()
+    return all(os.path.exists(p) and cache.get(os.path.abspath(p)) == key for p in paths)
+
+
+def mark_up_to_date(paths, key, options=None):
+    """Record that the outputs were just written for this key and encoding."""
+    key = _output_key(paths, key, options)
+    cache = _load_cache()
+    cache.update({os.path.abspath(p): key for p in paths})
+    with open(CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
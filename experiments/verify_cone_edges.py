@@ -6,6 +6,7 @@ transitions vs. hard staircase edges.
 """
 
 from PIL import Image
+import numpy as np
 import math
 
 TEXTURE_PATH = "../assets/sprites/effects/flashlight_cone_18deg.png"
@@ -13,7 +14,9 @@ TEXTURE_PATH = "../assets/sprites/effects/flashlight_cone_18deg.png"
 
 def analyze_edge_quality():
     img = Image.open(TEXTURE_PATH)
-    pixels = img.load()
+    # One contiguous (height, width) view of the alpha channel; all sampling
+    # below indexes into it instead of going through PixelAccess per pixel
+    alpha = np.asarray(img)[:, :, 3]
     width, height = img.size
     print(f"Texture size: {width}x{height}")
 
@@ -40,7 +43,7 @@ def analyze_edge_quality():
 
         alphas = []
         for y in range(max(0, start_y), min(height, end_y + 1)):
-            a = pixels[x, y][3]
+            a = alpha[y, x]
             alphas.append((y, a))
             if a > 0:
                 print(f"  pixel[{x},{y}] alpha={a}")
@@ -53,24 +56,19 @@ def analyze_edge_quality():
     start_y = int(center_y + edge_y - 5)
     end_y = int(center_y + edge_y + 5)
     for y in range(max(0, start_y), min(height, end_y + 1)):
-        a = pixels[x, y][3]
+        a = alpha[y, x]
         if a > 0 or (y >= int(center_y + edge_y - 2)):
             print(f"  pixel[{x},{y}] alpha={a}")
 
     # Count unique alpha values to verify gradual transitions
-    all_alphas = set()
-    for y in range(height):
-        for x in range(width):
-            a = pixels[x, y][3]
-            if 0 < a < 255:
-                all_alphas.add(a)
+    all_alphas = np.unique(alpha[(alpha > 0) & (alpha < 255)])
     print(f"\n=== Unique intermediate alpha values: {len(all_alphas)} ===")
     print(f"  (More = smoother transitions)")
 
     # Create a visualization showing the edge region magnified
     vis_size = 400
-    vis = Image.new("RGBA", (vis_size, vis_size), (0, 0, 0, 255))
-    vis_pixels = vis.load()
+    vis = np.zeros((vis_size, vis_size, 4), dtype=np.uint8)
+    vis[:, :, 3] = 255
 
     # Show a section of the cone edge at 75% radius, magnified 4x
     dist = int(width / 2.0 * 0.75)
@@ -78,16 +76,15 @@ def analyze_edge_quality():
     src_x_start = int(center_x + dist - vis_size // 8)
     src_y_start = int(center_y - edge_y_center - vis_size // 8)
 
-    for vy in range(vis_size):
-        for vx in range(vis_size):
-            src_x = src_x_start + vx // 4
-            src_y = src_y_start + vy // 4
-            if 0 <= src_x < width and 0 <= src_y < height:
-                r, g, b, a = pixels[src_x, src_y]
-                # Show alpha as grayscale on dark background
-                vis_pixels[vx, vy] = (a, a, a, 255)
+    src_x = src_x_start + np.arange(vis_size) // 4
+    src_y = src_y_start + np.arange(vis_size) // 4
+    vis_x = np.flatnonzero((src_x >= 0) & (src_x < width))
+    vis_y = np.flatnonzero((src_y >= 0) & (src_y < height))
+    # Show alpha as grayscale on dark background
+    block = alpha[np.ix_(src_y[vis_y], src_x[vis_x])]
+    vis[np.ix_(vis_y, vis_x, np.arange(3))] = block[:, :, np.newaxis]
 
-    vis.save("cone_edge_magnified.png")
+    Image.fromarray(vis, "RGBA").save("cone_edge_magnified.png", optimize=False, compress_level=1)
     print(f"\nSaved magnified edge visualization to: experiments/cone_edge_magnified.png")
 
 